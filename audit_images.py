@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Find near-duplicate and unreferenced images in slide-images/ using perceptual hashes."""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+# ─── Constants ───────────────────────────────────────────────────────────────
+BASE = os.path.dirname(os.path.abspath(__file__))
+IMG_DIR = os.path.join(BASE, "slide-images")
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".gif")
+
+# Files whose text decides whether an image is used; matched on the bare file name.
+REFERRERS = ("generate_pptx.py", "presentation.html")
+
+# 16x16 difference hash: 256 bits, enough to tell apart slides that share a template.
+HASH_SIZE = 16
+HASH_BITS = HASH_SIZE * HASH_SIZE
+# Fraction of differing bits that still counts as "near-identical". Distinct pages of the
+# same survey export differ in 32 bits (12.5%), so stay below that.
+DEFAULT_THRESHOLD = 0.10
+
+
+# ─── Hashing ─────────────────────────────────────────────────────────────────
+def dhash(img, size=HASH_SIZE):
+    """Difference hash: one bit per horizontally adjacent pixel pair of a size+1 x size greyscale thumbnail."""
+    small = img.resize((size + 1, size), Image.BOX, reducing_gap=2.0).convert("L")
+    px = small.tobytes()
+    bits = 0
+    for row in range(size):
+        line = px[row * (size + 1):(row + 1) * (size + 1)]
+        for a, b in zip(line, line[1:]):
+            bits = (bits << 1) | (a > b)
+    return bits
+
+
+def scan(path):
+    """Hash one file; runs in a worker thread (Pillow releases the GIL while decoding)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    with Image.open(path) as img:
+        img.draft("RGB", (HASH_SIZE * 8, HASH_SIZE * 8))  # JPEG only: decode at reduced scale
+        w, h = img.size
+        phash = dhash(img)
+    return {
+        "name": os.path.basename(path),
+        "bytes": len(data),
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "size": (w, h),
+        "dhash": phash,
+    }
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+# ─── Analysis ────────────────────────────────────────────────────────────────
+def references(names, referrers=REFERRERS):
+    """{image name: [referrer, ...]} for every image name found in the referrers' text."""
+    texts = {}
+    for rel in referrers:
+        with open(os.path.join(BASE, rel), encoding="utf-8") as f:
+            texts[rel] = f.read()
+    return {name: [rel for rel, text in texts.items() if name in text] for name in names}
+
+
+def clusters(images, threshold=DEFAULT_THRESHOLD):
+    """Group images whose hashes differ in at most threshold * HASH_BITS bits (single linkage)."""
+    parent = list(range(len(images)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    limit = threshold * HASH_BITS
+    for i in range(len(images)):
+        for j in range(i + 1, len(images)):
+            if hamming(images[i]["dhash"], images[j]["dhash"]) <= limit:
+                parent[find(j)] = find(i)
+
+    groups = {}
+    for i, img in enumerate(images):
+        groups.setdefault(find(i), []).append(img)
+    return [g for g in groups.values() if len(g) > 1]
+
+
+def canonical(group, refs):
+    """The image to keep: most referenced, then largest, then smallest file, then first by name."""
+    return min(group, key=lambda img: (-len(refs[img["name"]]), -img["size"][0] * img["size"][1],
+                                       img["bytes"], img["name"]))
+
+
+def audit(img_dir=IMG_DIR, threshold=DEFAULT_THRESHOLD, jobs=None):
+    names = sorted(n for n in os.listdir(img_dir) if n.lower().endswith(IMAGE_EXTS))
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        images = list(pool.map(scan, [os.path.join(img_dir, n) for n in names]))
+    refs = references(names)
+
+    report = {"images": len(images), "bytes": sum(img["bytes"] for img in images), "clusters": [],
+              "unreferenced": [img["name"] for img in images if not refs[img["name"]]]}
+    for group in sorted(clusters(images, threshold), key=lambda g: min(img["name"] for img in g)):
+        keep = canonical(group, refs)
+        exact = keep["sha256"]
+        report["clusters"].append({
+            "keep": keep["name"],
+            "members": [{
+                "name": img["name"],
+                "distance": hamming(keep["dhash"], img["dhash"]),
+                "identical": img["sha256"] == exact,
+                "bytes": img["bytes"],
+                "size": img["size"],
+                "referenced_by": refs[img["name"]],
+            } for img in sorted(group, key=lambda img: img["name"]) if img is not keep],
+        })
+    return report
+
+
+# ─── Main ────────────────────────────────────────────────────────────────────
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("folder", nargs="?", default=IMG_DIR, help="image folder (default slide-images/)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"fraction of the {HASH_BITS} hash bits that may differ (default {DEFAULT_THRESHOLD})")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker threads (default: CPU count + 4)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    report = audit(args.folder, args.threshold, args.jobs)
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+        return 0
+
+    print(f"🔍 {report['images']} images, {report['bytes'] / 1e6:.1f} MB, hashed in {elapsed:.2f} s")
+
+    repo_saving = deck_saving = 0
+    if report["clusters"]:
+        print(f"\nNear-duplicates (≤ {args.threshold:.0%} of {HASH_BITS} bits differ):")
+    for cluster in report["clusters"]:
+        print(f"  {cluster['keep']}  ← keep")
+        for m in cluster["members"]:
+            used = ", ".join(m["referenced_by"]) or "unreferenced"
+            kind = "identical" if m["identical"] else f"{m['distance']:3d} bits"
+            print(f"    {m['name']:<28} {kind:>9}  {m['bytes'] / 1e6:5.2f} MB  {used}")
+            repo_saving += m["bytes"]
+            if m["referenced_by"]:
+                deck_saving += m["bytes"]
+
+    unreferenced = report["unreferenced"]
+    if unreferenced:
+        print(f"\nUnreferenced in {' and '.join(REFERRERS)}:")
+        for name in unreferenced:
+            size = os.path.getsize(os.path.join(args.folder, name))
+            print(f"    {name:<28} {size / 1e6:5.2f} MB")
+
+    if report["clusters"]:
+        print(f"\nCollapsing every cluster to its kept image saves {repo_saving / 1e6:.1f} MB in the repo "
+              f"and {deck_saving / 1e6:.1f} MB of deck assets.")
+    elif not unreferenced:
+        print("   No near-duplicates or unreferenced images")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
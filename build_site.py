@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Build the GitHub Pages site into dist/ with web-sized images and an offline service worker."""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+
+from pptx_tools import recompress
+from survey_stats import impact_numbers, write_html_counters
+
+# ─── Constants ───────────────────────────────────────────────────────────────
+BASE = os.path.dirname(os.path.abspath(__file__))
+DIST = os.path.join(BASE, "dist")
+DECK = "presentation.html"
+PAGES = [DECK, "eform-answers.html", "hawk-talk-video-script.html"]
+DOCS_DIR = "docs"
+
+# Longest edge for deck images; the largest on-screen image is ~1100 CSS px wide.
+MAX_IMAGE_PX = 1600
+IMAGE_EXTS = (".png", ".jpg", ".jpeg")
+
+REF_RE = re.compile(r"""(?:src|href)="([^"#?]+)"|url\(['"]?([^'")#]+)['"]?\)""")
+FONT_CSS_RE = re.compile(r"""@import url\('(https://fonts\.googleapis\.com/[^']+)'\)""")
+
+SW_TEMPLATE = """// Generated by build_site.py; do not edit.
+const VERSION = "{version}";
+const PRECACHE = "deck-precache-" + VERSION;
+const RUNTIME = "deck-fonts";
+const FONT_HOSTS = ["fonts.googleapis.com", "fonts.gstatic.com"];
+const FONT_FILE_RE = /url\((https:\/\/fonts\.gstatic\.com\/[^)'"]+)\)/g;
+
+// Fetch a Google Fonts stylesheet and every font file it points at into the runtime cache,
+// so the first visit (which loads the fonts before this worker controls the page) is enough.
+async function cacheFonts(cache, cssUrl) {{
+  const res = await fetch(cssUrl, {{ mode: "cors", cache: "reload" }});
+  if (!res.ok) return;
+  const css = await res.clone().text();
+  await cache.put(cssUrl, res);
+  const files = [...new Set([...css.matchAll(FONT_FILE_RE)].map((m) => m[1]))];
+  await Promise.all(files.map(async (url) => {{
+    const font = await fetch(url, {{ mode: "cors" }});
+    if (font.ok) await cache.put(url, font);
+  }}));
+}}
+
+self.addEventListener("install", (event) => {{
+  event.waitUntil((async () => {{
+    const manifest = await (await fetch("precache-manifest.json?v=" + VERSION, {{ cache: "no-cache" }})).json();
+    const cache = await caches.open(PRECACHE);
+    // Bypass the HTTP cache: Pages sends max-age=600, so a new version could otherwise
+    // precache the previous deploy's files.
+    await cache.addAll(manifest.assets.map((a) => new Request(a.url, {{ cache: "reload" }})));
+    const fonts = await caches.open(RUNTIME);
+    await Promise.all(manifest.external.map((url) => cacheFonts(fonts, url).catch(() => {{}})));
+    await self.skipWaiting();
+  }})());
+}});
+
+self.addEventListener("activate", (event) => {{
+  event.waitUntil((async () => {{
+    for (const key of await caches.keys()) {{
+      if (key !== PRECACHE && key !== RUNTIME) await caches.delete(key);
+    }}
+    await self.clients.claim();
+  }})());
+}});
+
+self.addEventListener("fetch", (event) => {{
+  const req = event.request;
+  if (req.method !== "GET") return;
+  const url = new URL(req.url);
+
+  if (FONT_HOSTS.includes(url.hostname)) {{
+    // Cache-first: font files are immutable, and the CSS is pinned per deck version.
+    event.respondWith(caches.open(RUNTIME).then(async (cache) => {{
+      // The stylesheet varies on User-Agent/Referer; the copy cached at install is still right.
+      const hit = await cache.match(req, {{ ignoreVary: true }});
+      if (hit) return hit;
+      const res = await fetch(req);
+      cache.put(req, res.clone());
+      return res;
+    }}));
+    return;
+  }}
+
+  if (url.origin === self.location.origin) {{
+    event.respondWith(caches.match(req, {{ ignoreSearch: true, cacheName: PRECACHE }})
+      .then((hit) => hit || fetch(req)));
+  }}
+}});
+"""
+
+
+# ─── Helpers ─────────────────────────────────────────────────────────────────
+def digest(data):
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def local_refs(html):
+    """Same-origin asset paths referenced by a page, in document order."""
+    refs = []
+    for m in REF_RE.finditer(html):
+        ref = m.group(1) or m.group(2)
+        if "://" in ref or ref.startswith(("data:", "mailto:", "/")) or ref in refs:
+            continue
+        refs.append(ref)
+    return refs
+
+
+def copy_asset(rel):
+    """Copy one asset into dist/, downscaling oversized images; returns the written bytes."""
+    src = os.path.join(BASE, rel)
+    dst = os.path.join(DIST, rel)
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    with open(src, "rb") as f:
+        data = f.read()
+    if rel.lower().endswith(IMAGE_EXTS):
+        data = recompress(data, MAX_IMAGE_PX, MAX_IMAGE_PX) or data
+    with open(dst, "wb") as f:
+        f.write(data)
+    return data
+
+
+# ─── Build ───────────────────────────────────────────────────────────────────
+def build():
+    shutil.rmtree(DIST, ignore_errors=True)
+    pages = PAGES + sorted(os.path.join(DOCS_DIR, n) for n in os.listdir(os.path.join(BASE, DOCS_DIR))
+                           if n.endswith(".html"))
+    written = {}
+    deck_assets = []
+    external = []
+    for page in pages:
+        with open(os.path.join(BASE, page), encoding="utf-8") as f:
+            html = f.read()
+        written[page] = copy_asset(page)
+        page_dir = os.path.dirname(page)
+        for ref in local_refs(html):
+            rel = os.path.normpath(os.path.join(page_dir, ref))
+            if rel in written:
+                pass
+            elif not os.path.isfile(os.path.join(BASE, rel)):
+                print(f"⚠️  {page}: missing {ref}")
+                continue
+            else:
+                written[rel] = copy_asset(rel)
+            if page == DECK:
+                deck_assets.append(rel)
+        if page == DECK:
+            external = FONT_CSS_RE.findall(html)
+
+    precache = [DECK] + sorted(set(deck_assets) - {DECK})
+    manifest = {
+        "assets": [{"url": rel, "revision": digest(written[rel])} for rel in precache],
+        "external": external,
+    }
+    manifest_json = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+    version = digest(manifest_json.encode())
+    with open(os.path.join(DIST, "precache-manifest.json"), "w", encoding="utf-8") as f:
+        f.write(manifest_json)
+    with open(os.path.join(DIST, "sw.js"), "w", encoding="utf-8") as f:
+        f.write(SW_TEMPLATE.format(version=version))
+    return written, manifest, version
+
+
+# ─── Main ────────────────────────────────────────────────────────────────────
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.parse_args(argv)
+
+    # The deck's counters carry their own copy of the slide 13 numbers; refresh them before copying.
+    impact, _ = impact_numbers()
+    if write_html_counters(impact, os.path.join(BASE, DECK)):
+        print(f"✅ Updated the impact counters in {DECK}")
+    written, manifest, version = build()
+    before = sum(os.path.getsize(os.path.join(BASE, rel)) for rel in written)
+    after = sum(len(data) for data in written.values())
+    precached = sum(len(written[a["url"]]) for a in manifest["assets"])
+    print(f"✅ Built {DIST} ({len(written)} files, {before / 1e6:.1f} MB → {after / 1e6:.1f} MB)")
+    print(f"   Service worker {version}: {len(manifest['assets'])} deck assets, {precached / 1e6:.1f} MB precached")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,9 +5,16 @@ from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
-from pptx.enum.shapes import MSO_SHAPE
+import argparse
+import functools
 import os
 
+from image_index import ImageIndex, fit_box
+from image_prefetch import ImagePrefetcher
+from pptx_tools import parse_slide_spec, prune_layouts, save_deterministic
+from shape_batch import ShapeBatch, emit, lines_xml, paragraph_xml, picture_xml, run_xml, shape_xml, textbox_xml
+from survey_stats import impact_numbers
+
 # ─── Constants ───────────────────────────────────────────────────────────────
 BASE = os.path.dirname(os.path.abspath(__file__))
 IMG = os.path.join(BASE, "slide-images")
@@ -26,6 +33,14 @@ BLUE_ACC = RGBColor(0x4A, 0x90, 0xD9)
 SLIDE_W = Inches(13.333)
 SLIDE_H = Inches(7.5)
 
+# Header-only image dimensions, persisted between builds
+IMAGES = ImageIndex()
+# Image files read and hashed on a thread pool ahead of the slide being built
+PREFETCH = ImagePrefetcher()
+PREFETCH_AHEAD = 3   # slides whose declared images are queued beyond the current one
+# Slide 13 numbers and their source, read once per run; main() reports the source
+read_impact = functools.cache(impact_numbers)
+
 FONT_TITLE = "Georgia"       # fallback for Playfair Display
 FONT_BODY  = "Calibri"       # fallback for Inter
 
@@ -49,207 +64,190 @@ def set_gradient_bg(slide, c1, c2):
     fill.gradient_stops[1].position = 1.0
 
 
-def add_textbox(slide, left, top, width, height):
-    return slide.shapes.add_textbox(left, top, width, height)
-
-
-def set_text(tf, text, font_name=FONT_BODY, size=Pt(18), color=WHITE, bold=False, italic=False, alignment=PP_ALIGN.LEFT):
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.text = text
-    p.alignment = alignment
-    run = p.runs[0]
-    run.font.name = font_name
-    run.font.size = size
-    run.font.color.rgb = color
-    run.font.bold = bold
-    run.font.italic = italic
-    return p
-
-
-def add_run(paragraph, text, font_name=FONT_BODY, size=Pt(18), color=WHITE, bold=False, italic=False):
-    run = paragraph.add_run()
-    run.text = text
-    run.font.name = font_name
-    run.font.size = size
-    run.font.color.rgb = color
-    run.font.bold = bold
-    run.font.italic = italic
-    return run
-
-
-def add_paragraph(tf, text="", font_name=FONT_BODY, size=Pt(18), color=WHITE, bold=False, italic=False, alignment=PP_ALIGN.LEFT, space_before=Pt(0), space_after=Pt(0)):
-    p = tf.add_paragraph()
-    p.alignment = alignment
-    p.space_before = space_before
-    p.space_after = space_after
-    if text:
-        run = p.add_run()
-        run.text = text
-        run.font.name = font_name
-        run.font.size = size
-        run.font.color.rgb = color
-        run.font.bold = bold
-        run.font.italic = italic
-    return p
-
-
-def add_accent_line(slide, left, top, width=Inches(1.2), height=Pt(4)):
-    shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, width, height)
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = GOLD
-    shape.line.fill.background()
-    return shape
-
-
-def add_image_safe(slide, path, left, top, width=None, height=None):
-    if os.path.exists(path):
-        kwargs = {"left": left, "top": top}
-        if width:
-            kwargs["width"] = width
-        if height:
-            kwargs["height"] = height
-        return slide.shapes.add_picture(path, **kwargs)
-    return None
-
-
-def add_card_bg(slide, left, top, width, height, border_color=None):
+def add_text(batch, left, top, width, height, text, font_name=FONT_BODY, size=Pt(18), color=WHITE, bold=False, italic=False, alignment=PP_ALIGN.LEFT):
+    """Textbox with `text` in one paragraph, every line styled alike."""
+    p = paragraph_xml(lines_xml(text, font_name, size, color, bold, italic), alignment)
+    emit(batch, textbox_xml(left, top, width, height, [p]))
+
+
+def add_textbox(batch, left, top, width, height, paragraphs, wrap=True):
+    """Textbox from paragraph_xml() fragments, for text that mixes styles or has several paragraphs."""
+    emit(batch, textbox_xml(left, top, width, height, paragraphs, wrap))
+
+
+def run(text, font_name=FONT_BODY, size=Pt(18), color=WHITE, bold=False, italic=False):
+    return run_xml(text, font_name, size, color, bold, italic)
+
+
+def add_accent_line(batch, left, top, width=Inches(1.2), height=Pt(4)):
+    emit(batch, shape_xml("rect", left, top, width, height, fill=GOLD))
+
+
+def add_image_safe(batch, path, left, top, width=None, height=None, fit=None):
+    """Add a picture if the file exists, taking the bytes from PREFETCH.
+
+    With `fit` ("contain", "cover" or "center") and both width and height, the image is
+    placed in that box using header-only dimensions from IMAGES; "cover" crops the overflow.
+    """
+    image = PREFETCH.get(path)
+    if image is None:
+        return
+    crop = None
+    if fit and width and height:
+        img_w, img_h = IMAGES.size(path)
+        dx, dy, width, height, crop = fit_box(fit, width, height, img_w, img_h)
+        left, top = left + dx, top + dy
+    emit(batch, picture_xml(batch.slide, image, left, top, width, height, crop))
+
+
+def add_card_bg(batch, left, top, width, height, border_color=None):
     """Add a rounded rectangle card background."""
-    shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left, top, width, height)
-    shape.fill.solid()
-    shape.fill.fore_color.rgb = RGBColor(0x14, 0x20, 0x35)
     if border_color:
-        shape.line.color.rgb = border_color
-        shape.line.width = Pt(2)
+        line, line_width = border_color, Pt(2)
     else:
-        shape.line.color.rgb = RGBColor(0x2A, 0x35, 0x50)
-        shape.line.width = Pt(1)
-    return shape
-
-
-def add_slide_number(slide, num, total=17):
-    tb = add_textbox(slide, Inches(12.3), Inches(7.0), Inches(1.0), Inches(0.4))
-    set_text(tb.text_frame, f"{num} / {total}", size=Pt(11), color=DIM, alignment=PP_ALIGN.RIGHT)
+        line, line_width = RGBColor(0x2A, 0x35, 0x50), Pt(1)
+    emit(batch, shape_xml("roundRect", left, top, width, height,
+                          fill=RGBColor(0x14, 0x20, 0x35), line=line, line_width=line_width))
+
+
+def add_slide_number(batch, num, total):
+    add_text(batch, Inches(12.3), Inches(7.0), Inches(1.0), Inches(0.4),
+             f"{num} / {total}", size=Pt(11), color=DIM, alignment=PP_ALIGN.RIGHT)
+
+
+# ─── Slide Registry ──────────────────────────────────────────────────────────
+SLIDES = []
+
+# Image files in slide-images/. Each is named once: the builder places it and its
+# @register_slide(images=...) declares it for prefetching from the same constant.
+HOOK_IMAGE = "s2-hook.png"
+# (image, title, description, color) per card on slide 5
+BUILT_CARDS = [
+    ("s5-curriculum.png", "Leadership Curriculum", "Transformational, democratic, adaptive & collaborative leadership workshops with case studies", GOLD),
+    ("s5-assessment.png", "Assessment Tools", "Leadership questionnaire & activity interest survey to measure growth and guide programming", TEAL),
+    ("s5-events.png", "Events & Workshops", "2 leadership workshops, 2 ice breaker events, plus full Spring 2026 programming calendar", CORAL),
+    ("s5-outreach.png", "Outreach Materials", "Healthy Futures flyer, program poster, promotional materials for recruitment & community partners", BLUE_ACC),
+]
+# (image, phase, date, detail, color) per stop on slide 6
+TIMELINE_PHASES = [
+    ("s6-foundation.png", "Foundation", "Fall 2025", "Grant Secured\nProgram Design\nRecruitment", GOLD),
+    ("s6-launch.png", "Launch", "Nov 2025", "Ice Breaker Events\nTeam Building\n20-30 Ambassadors", TEAL),
+    ("s6-workshops.png", "Workshops", "Nov-Dec 2025", "Leadership Training\nTransformational\nLeadership Focus", CORAL),
+    ("s6-growth.png", "Growth", "Spring 2026", "Simulation Field Trip\nMentorship Training\nInterest Surveys", BLUE_ACC),
+    ("s6-future.png", "Future", "2026+", "Community Outreach\nLeaders Symposium\nHealthy Futures", WHITE),
+]
+# Workshop slide thumbnails, 2x2 on slides 7 and 9
+WS1_IMAGES = ["ws1-01.png", "ws1-03.png", "ws1-05.png", "ws1-09.png"]
+WS2_IMAGES = ["ws2-01.png", "ws2-03.png", "ws2-04.png", "ws2-11.png"]
+SURVEY_IMAGE = "survey-3.png"
+CHALLENGES_IMAGE = "s11-challenges.png"
+BREAKTHROUGH_IMAGE = "s12-breakthrough.png"
+CASE_STUDY_IMAGE = "ws2-09.png"
+PURPOSE_IMAGE = "ws2-10.png"
+
+
+def register_slide(builder=None, *, images=()):
+    """Register a slide builder. Decks follow registration order, which sets each slide's number.
+
+    A builder gets a new blank slide and a ShapeBatch for it, and places every shape
+    through the batch. `images` lists the files it places (names in slide-images/ or
+    full paths), so build() can prefetch them; use as @register_slide(images=[...]).
+    """
+    if builder is None:
+        return functools.partial(register_slide, images=images)
+    builder.images = [os.path.join(IMG, name) for name in images]
+    SLIDES.append(builder)
+    return builder
 
 
 # ─── Slide Builders ──────────────────────────────────────────────────────────
 
-def slide_01_title(prs):
+@register_slide(images=[LOGO])
+def slide_01_title(slide, batch):
     """Title slide: Building Leaders from the Ground Up"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])  # blank
     set_gradient_bg(slide, NAVY, TEAL)
 
     # Badge
-    tb = add_textbox(slide, Inches(0.8), Inches(0.5), Inches(6), Inches(0.5))
-    set_text(tb.text_frame, "● Monmouth University Scholarship Week 2026", size=Pt(16), color=GOLD, bold=True)
+    add_text(batch, Inches(0.8), Inches(0.5), Inches(6), Inches(0.5), "● Monmouth University Scholarship Week 2026", size=Pt(16), color=GOLD, bold=True)
 
     # Title
-    tb = add_textbox(slide, Inches(0.8), Inches(1.2), Inches(6.5), Inches(3.0))
-    tf = tb.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    add_run(p, "Building\n", FONT_TITLE, Pt(52), WHITE, bold=True)
-    add_run(p, "Leaders\n", FONT_TITLE, Pt(52), GOLD, bold=True)
-    add_run(p, "from the ", FONT_TITLE, Pt(36), DIM, bold=True)
-    add_run(p, "Ground Up", FONT_TITLE, Pt(44), TEAL, bold=True)
+    add_textbox(batch, Inches(0.8), Inches(1.2), Inches(6.5), Inches(3.0), [paragraph_xml([
+        run("Building\n", FONT_TITLE, Pt(52), WHITE, bold=True),
+        run("Leaders\n", FONT_TITLE, Pt(52), GOLD, bold=True),
+        run("from the ", FONT_TITLE, Pt(36), DIM, bold=True),
+        run("Ground Up", FONT_TITLE, Pt(44), TEAL, bold=True),
+    ])])
 
     # Accent line
-    add_accent_line(slide, Inches(0.8), Inches(4.4), Inches(2))
+    add_accent_line(batch, Inches(0.8), Inches(4.4), Inches(2))
 
     # Subtitle
-    tb = add_textbox(slide, Inches(0.8), Inches(4.7), Inches(6), Inches(1.2))
-    tf = tb.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    add_run(p, "How a Graduate Assistant Designed, Launched,\nand Grew the ", FONT_BODY, Pt(18), LIGHT)
-    add_run(p, "SNHS Student\nAmbassador Program", FONT_BODY, Pt(18), GOLD, bold=True)
+    add_textbox(batch, Inches(0.8), Inches(4.7), Inches(6), Inches(1.2), [paragraph_xml([
+        run("How a Graduate Assistant Designed, Launched,\nand Grew the ", FONT_BODY, Pt(18), LIGHT),
+        run("SNHS Student\nAmbassador Program", FONT_BODY, Pt(18), GOLD, bold=True),
+    ])])
 
     # Presenter card
-    card = add_card_bg(slide, Inches(7.8), Inches(0.8), Inches(3.3), Inches(4.5))
+    add_card_bg(batch, Inches(7.8), Inches(0.8), Inches(3.3), Inches(4.5))
 
-    tb = add_textbox(slide, Inches(7.9), Inches(1.0), Inches(3.1), Inches(0.3))
-    set_text(tb.text_frame, "PRESENTED BY", size=Pt(10), color=DIM, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(7.9), Inches(1.0), Inches(3.1), Inches(0.3), "PRESENTED BY", size=Pt(10), color=DIM, alignment=PP_ALIGN.CENTER)
 
-    tb = add_textbox(slide, Inches(7.9), Inches(1.4), Inches(3.1), Inches(0.6))
-    set_text(tb.text_frame, "Bingjun Li", FONT_TITLE, Pt(32), WHITE, bold=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(7.9), Inches(1.4), Inches(3.1), Inches(0.6), "Bingjun Li", FONT_TITLE, Pt(32), WHITE, bold=True, alignment=PP_ALIGN.CENTER)
 
-    tb = add_textbox(slide, Inches(7.9), Inches(2.0), Inches(3.1), Inches(0.4))
-    set_text(tb.text_frame, "M.S.Ed.", size=Pt(16), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(7.9), Inches(2.0), Inches(3.1), Inches(0.4), "M.S.Ed.", size=Pt(16), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
 
-    tb = add_textbox(slide, Inches(7.9), Inches(2.5), Inches(3.1), Inches(0.4))
-    set_text(tb.text_frame, "Graduate Assistant", size=Pt(16), color=LIGHT, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(7.9), Inches(2.5), Inches(3.1), Inches(0.4), "Graduate Assistant", size=Pt(16), color=LIGHT, alignment=PP_ALIGN.CENTER)
 
-    tb = add_textbox(slide, Inches(7.9), Inches(3.2), Inches(3.1), Inches(0.3))
-    set_text(tb.text_frame, "— MENTORED BY —", size=Pt(9), color=TEAL, bold=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(7.9), Inches(3.2), Inches(3.1), Inches(0.3), "— MENTORED BY —", size=Pt(9), color=TEAL, bold=True, alignment=PP_ALIGN.CENTER)
 
-    tb = add_textbox(slide, Inches(7.9), Inches(3.5), Inches(3.1), Inches(0.5))
-    set_text(tb.text_frame, "Dr. Clifford", FONT_TITLE, Pt(24), GOLD, bold=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(7.9), Inches(3.5), Inches(3.1), Inches(0.5), "Dr. Clifford", FONT_TITLE, Pt(24), GOLD, bold=True, alignment=PP_ALIGN.CENTER)
 
-    tb = add_textbox(slide, Inches(7.9), Inches(4.0), Inches(3.1), Inches(0.4))
-    set_text(tb.text_frame, "Acting Dean, SNHS", size=Pt(13), color=DIM, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(7.9), Inches(4.0), Inches(3.1), Inches(0.4), "Acting Dean, SNHS", size=Pt(13), color=DIM, alignment=PP_ALIGN.CENTER)
 
     # Logo
-    add_image_safe(slide, LOGO, Inches(11.4), Inches(1.2), height=Inches(3.8))
+    add_image_safe(batch, LOGO, Inches(11.4), Inches(1.2), height=Inches(3.8))
 
-    add_slide_number(slide, 1)
 
-
-def slide_02_hook(prs):
+@register_slide(images=[HOOK_IMAGE])
+def slide_02_hook(slide, batch):
     """The Hook: shared vision"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
     set_slide_bg(slide, NAVY)
 
     # Left text
-    tb = add_textbox(slide, Inches(0.8), Inches(1.0), Inches(5.5), Inches(0.6))
-    set_text(tb.text_frame, "It started with a conversation", FONT_TITLE, Pt(24), DIM)
+    add_text(batch, Inches(0.8), Inches(1.0), Inches(5.5), Inches(0.6), "It started with a conversation", FONT_TITLE, Pt(24), DIM)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(1.7), Inches(5.5), Inches(1.2))
-    tf = tb.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    add_run(p, "A ", FONT_TITLE, Pt(36), WHITE, bold=True)
-    add_run(p, "shared vision", FONT_TITLE, Pt(36), GOLD, bold=True)
-    add_run(p, ",\na mentor, and a plan", FONT_TITLE, Pt(36), WHITE, bold=True)
+    add_textbox(batch, Inches(0.8), Inches(1.7), Inches(5.5), Inches(1.2), [paragraph_xml([
+        run("A ", FONT_TITLE, Pt(36), WHITE, bold=True),
+        run("shared vision", FONT_TITLE, Pt(36), GOLD, bold=True),
+        run(",\na mentor, and a plan", FONT_TITLE, Pt(36), WHITE, bold=True),
+    ])])
 
     # Quote block
-    quote_bg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0.8), Inches(3.3), Inches(5.5), Inches(1.5))
-    quote_bg.fill.solid()
-    quote_bg.fill.fore_color.rgb = RGBColor(0x1A, 0x25, 0x38)
-    quote_bg.line.fill.background()
+    emit(batch, shape_xml("rect", Inches(0.8), Inches(3.3), Inches(5.5), Inches(1.5), fill=RGBColor(0x1A, 0x25, 0x38)))
     # Gold left border
-    border = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0.8), Inches(3.3), Pt(4), Inches(1.5))
-    border.fill.solid()
-    border.fill.fore_color.rgb = GOLD
-    border.line.fill.background()
+    emit(batch, shape_xml("rect", Inches(0.8), Inches(3.3), Pt(4), Inches(1.5), fill=GOLD))
 
-    tb = add_textbox(slide, Inches(1.0), Inches(3.4), Inches(5.2), Inches(1.3))
-    set_text(tb.text_frame, "Dr. Clifford shared her ideas for a student leadership program. We brainstormed events, surveyed students, and shaped the workshops together based on real feedback.", size=Pt(17), color=WHITE, italic=True)
+    add_text(batch, Inches(1.0), Inches(3.4), Inches(5.2), Inches(1.3), "Dr. Clifford shared her ideas for a student leadership program. We brainstormed events, surveyed students, and shaped the workshops together based on real feedback.", size=Pt(17), color=WHITE, italic=True)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(5.0), Inches(5.5), Inches(0.5))
-    set_text(tb.text_frame, "With her guidance, I built it from the ground up.", size=Pt(17), color=LIGHT)
+    add_text(batch, Inches(0.8), Inches(5.0), Inches(5.5), Inches(0.5), "With her guidance, I built it from the ground up.", size=Pt(17), color=LIGHT)
 
     # Right image
-    add_image_safe(slide, os.path.join(IMG, "s2-hook.png"), Inches(7.0), Inches(0.5), height=Inches(6.3))
-
-    add_slide_number(slide, 2)
+    add_image_safe(batch, os.path.join(IMG, HOOK_IMAGE), Inches(7.0), Inches(0.5), height=Inches(6.3))
 
 
-def slide_03_who_am_i(prs):
+@register_slide
+def slide_03_who_am_i(slide, batch):
     """Who Am I: From Classroom to Program Builder"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
     set_slide_bg(slide, BLUE)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(0.5), Inches(5.5), Inches(0.4))
-    set_text(tb.text_frame, "Who Am I", size=Pt(20), color=GOLD, bold=True)
+    add_text(batch, Inches(0.8), Inches(0.5), Inches(5.5), Inches(0.4), "Who Am I", size=Pt(20), color=GOLD, bold=True)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(1.0), Inches(5.5), Inches(1.2))
-    tf = tb.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    add_run(p, "From Classroom\nto ", FONT_TITLE, Pt(36), WHITE, bold=True)
-    add_run(p, "Program Builder", FONT_TITLE, Pt(36), GOLD, bold=True)
+    add_textbox(batch, Inches(0.8), Inches(1.0), Inches(5.5), Inches(1.2), [paragraph_xml([
+        run("From Classroom\nto ", FONT_TITLE, Pt(36), WHITE, bold=True),
+        run("Program Builder", FONT_TITLE, Pt(36), GOLD, bold=True),
+    ])])
 
-    add_accent_line(slide, Inches(0.8), Inches(2.4))
+    add_accent_line(batch, Inches(0.8), Inches(2.4))
 
     bullets = [
         ("Bingjun Li", " — M.S.Ed. Graduate Assistant"),
@@ -257,92 +255,61 @@ def slide_03_who_am_i(prs):
         ("", "Tasked with building the Student Ambassador Program from concept to reality"),
         ("", "Education background meeting healthcare leadership — a unique intersection"),
     ]
-    tb = add_textbox(slide, Inches(0.8), Inches(2.7), Inches(5.5), Inches(4.0))
-    tf = tb.text_frame
-    tf.word_wrap = True
-    for i, (bold_part, rest) in enumerate(bullets):
-        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
-        p.space_before = Pt(8)
-        add_run(p, "● ", FONT_BODY, Pt(17), GOLD)
+    paragraphs = []
+    for bold_part, rest in bullets:
+        runs = [run("● ", FONT_BODY, Pt(17), GOLD)]
         if bold_part:
-            add_run(p, bold_part, FONT_BODY, Pt(17), WHITE, bold=True)
-        add_run(p, rest, FONT_BODY, Pt(17), LIGHT)
+            runs.append(run(bold_part, FONT_BODY, Pt(17), WHITE, bold=True))
+        runs.append(run(rest, FONT_BODY, Pt(17), LIGHT))
+        paragraphs.append(paragraph_xml(runs, space_before=Pt(8)))
+    add_textbox(batch, Inches(0.8), Inches(2.7), Inches(5.5), Inches(4.0), paragraphs)
 
     # Right side: intersection visual (static)
-    # Education circle
-    edu = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(7.5), Inches(1.5), Inches(2.5), Inches(2.5))
-    edu.fill.solid()
-    edu.fill.fore_color.rgb = RGBColor(0x1A, 0x30, 0x50)
-    edu.line.color.rgb = GOLD
-    edu.line.width = Pt(2)
-    tb = add_textbox(slide, Inches(7.7), Inches(2.2), Inches(2.1), Inches(1.2))
-    tf = tb.text_frame
-    set_text(tf, "🎓 Education", FONT_BODY, Pt(18), GOLD, bold=True, alignment=PP_ALIGN.CENTER)
-    add_paragraph(tf, "Curriculum · Pedagogy\nAssessment", size=Pt(12), color=LIGHT, alignment=PP_ALIGN.CENTER)
-
-    # Healthcare circle
-    hc = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(9.8), Inches(1.5), Inches(2.5), Inches(2.5))
-    hc.fill.solid()
-    hc.fill.fore_color.rgb = RGBColor(0x14, 0x30, 0x35)
-    hc.line.color.rgb = TEAL
-    hc.line.width = Pt(2)
-    tb = add_textbox(slide, Inches(10.0), Inches(2.2), Inches(2.1), Inches(1.2))
-    tf = tb.text_frame
-    set_text(tf, "🩺 Healthcare", FONT_BODY, Pt(18), TEAL, bold=True, alignment=PP_ALIGN.CENTER)
-    add_paragraph(tf, "Leadership · Clinical\nCommunity", size=Pt(12), color=LIGHT, alignment=PP_ALIGN.CENTER)
+    circles = [
+        # (circle left, fill, outline, text left, heading, detail)
+        (7.5, RGBColor(0x1A, 0x30, 0x50), GOLD, 7.7, "🎓 Education", "Curriculum · Pedagogy\nAssessment"),
+        (9.8, RGBColor(0x14, 0x30, 0x35), TEAL, 10.0, "🩺 Healthcare", "Leadership · Clinical\nCommunity"),
+    ]
+    for x, fill, color, text_x, heading, detail in circles:
+        emit(batch, shape_xml("ellipse", Inches(x), Inches(1.5), Inches(2.5), Inches(2.5),
+                              fill=fill, line=color, line_width=Pt(2)))
+        add_textbox(batch, Inches(text_x), Inches(2.2), Inches(2.1), Inches(1.2), [
+            paragraph_xml(lines_xml(heading, FONT_BODY, Pt(18), color, bold=True), PP_ALIGN.CENTER),
+            paragraph_xml(run(detail, size=Pt(12), color=LIGHT), PP_ALIGN.CENTER, Pt(0), Pt(0)),
+        ])
 
     # Center label
-    center_shape = slide.shapes.add_shape(MSO_SHAPE.OVAL, Inches(8.8), Inches(4.5), Inches(2.2), Inches(2.2))
-    center_shape.fill.solid()
-    center_shape.fill.fore_color.rgb = RGBColor(0x18, 0x2E, 0x42)
-    center_shape.line.color.rgb = CORAL
-    center_shape.line.width = Pt(2)
-    tb = add_textbox(slide, Inches(8.9), Inches(4.9), Inches(2.0), Inches(1.4))
-    tf = tb.text_frame
-    set_text(tf, "Student\nAmbassador\nProgram", FONT_BODY, Pt(14), WHITE, bold=True, alignment=PP_ALIGN.CENTER)
+    emit(batch, shape_xml("ellipse", Inches(8.8), Inches(4.5), Inches(2.2), Inches(2.2),
+                          fill=RGBColor(0x18, 0x2E, 0x42), line=CORAL, line_width=Pt(2)))
+    add_text(batch, Inches(8.9), Inches(4.9), Inches(2.0), Inches(1.4), "Student\nAmbassador\nProgram", FONT_BODY, Pt(14), WHITE, bold=True, alignment=PP_ALIGN.CENTER)
 
-    tb = add_textbox(slide, Inches(7.5), Inches(6.9), Inches(4.8), Inches(0.4))
-    set_text(tb.text_frame, "Where education meets healthcare leadership", size=Pt(13), color=DIM, italic=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(7.5), Inches(6.9), Inches(4.8), Inches(0.4), "Where education meets healthcare leadership", size=Pt(13), color=DIM, italic=True, alignment=PP_ALIGN.CENTER)
 
-    add_slide_number(slide, 3)
 
-
-def slide_04_mission(prs):
+@register_slide
+def slide_04_mission(slide, batch):
     """The Mission: What Is the Student Ambassador Program?"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
     set_gradient_bg(slide, NAVY, RGBColor(0x1A, 0x4A, 0x42))
 
-    tb = add_textbox(slide, Inches(0.8), Inches(0.5), Inches(10), Inches(0.4))
-    set_text(tb.text_frame, "The Mission", size=Pt(20), color=GOLD, bold=True)
+    add_text(batch, Inches(0.8), Inches(0.5), Inches(10), Inches(0.4), "The Mission", size=Pt(20), color=GOLD, bold=True)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(1.0), Inches(10), Inches(0.8))
-    set_text(tb.text_frame, "What Is the Student Ambassador Program?", FONT_TITLE, Pt(36), WHITE, bold=True)
+    add_text(batch, Inches(0.8), Inches(1.0), Inches(10), Inches(0.8), "What Is the Student Ambassador Program?", FONT_TITLE, Pt(36), WHITE, bold=True)
 
-    add_accent_line(slide, Inches(0.8), Inches(2.0))
+    add_accent_line(batch, Inches(0.8), Inches(2.0))
 
-    tb = add_textbox(slide, Inches(0.8), Inches(2.3), Inches(10), Inches(1.0))
-    tf = tb.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    add_run(p, "A ", FONT_BODY, Pt(18), LIGHT)
-    add_run(p, "one-year leadership development program", FONT_BODY, Pt(18), GOLD, bold=True)
-    add_run(p, " for 20-30 SNHS undergraduate students who represent the school, lead health promotion initiatives, and grow as future healthcare leaders.", FONT_BODY, Pt(18), LIGHT)
+    add_textbox(batch, Inches(0.8), Inches(2.3), Inches(10), Inches(1.0), [paragraph_xml([
+        run("A ", FONT_BODY, Pt(18), LIGHT),
+        run("one-year leadership development program", FONT_BODY, Pt(18), GOLD, bold=True),
+        run(" for 20-30 SNHS undergraduate students who represent the school, lead health promotion initiatives, and grow as future healthcare leaders.", FONT_BODY, Pt(18), LIGHT),
+    ])])
 
     # Tags
     tags = [("Transformational", GOLD), ("Democratic", TEAL), ("Adaptive", CORAL), ("Collaborative", GOLD)]
     left = Inches(0.8)
     for tag_text, tag_color in tags:
-        shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left, Inches(3.5), Inches(2.2), Inches(0.5))
-        shape.fill.solid()
-        shape.fill.fore_color.rgb = RGBColor(tag_color[0] // 4, tag_color[1] // 4, tag_color[2] // 4)
-        shape.line.fill.background()
-        tf = shape.text_frame
-        tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-        run = tf.paragraphs[0].add_run()
-        run.text = tag_text
-        run.font.size = Pt(15)
-        run.font.color.rgb = tag_color
-        run.font.bold = True
+        emit(batch, shape_xml("roundRect", left, Inches(3.5), Inches(2.2), Inches(0.5),
+                              fill=RGBColor(tag_color[0] // 4, tag_color[1] // 4, tag_color[2] // 4),
+                              paragraphs=[paragraph_xml(run(tag_text, size=Pt(15), color=tag_color, bold=True), PP_ALIGN.CENTER)]))
         left += Inches(2.4)
 
     # Four pillars
@@ -355,167 +322,112 @@ def slide_04_mission(prs):
     for i, (icon, label, sub, color) in enumerate(pillars):
         x = Inches(0.8 + i * 3.1)
         # Bar accent
-        bar = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, x, Inches(4.5), Inches(2.8), Pt(4))
-        bar.fill.solid()
-        bar.fill.fore_color.rgb = color
-        bar.line.fill.background()
+        emit(batch, shape_xml("rect", x, Inches(4.5), Inches(2.8), Pt(4), fill=color))
         # Card bg
-        add_card_bg(slide, x, Inches(4.7), Inches(2.8), Inches(2.5), color)
+        add_card_bg(batch, x, Inches(4.7), Inches(2.8), Inches(2.5), color)
         # Icon
-        tb = add_textbox(slide, x, Inches(4.8), Inches(2.8), Inches(0.5))
-        set_text(tb.text_frame, icon, size=Pt(28), alignment=PP_ALIGN.CENTER)
+        add_text(batch, x, Inches(4.8), Inches(2.8), Inches(0.5), icon, size=Pt(28), alignment=PP_ALIGN.CENTER)
         # Label
-        tb = add_textbox(slide, x, Inches(5.3), Inches(2.8), Inches(0.8))
-        set_text(tb.text_frame, label, FONT_BODY, Pt(16), color, bold=True, alignment=PP_ALIGN.CENTER)
+        add_text(batch, x, Inches(5.3), Inches(2.8), Inches(0.8), label, FONT_BODY, Pt(16), color, bold=True, alignment=PP_ALIGN.CENTER)
         # Sub
-        tb = add_textbox(slide, x, Inches(6.1), Inches(2.8), Inches(0.8))
-        set_text(tb.text_frame, sub, FONT_BODY, Pt(13), LIGHT, alignment=PP_ALIGN.CENTER)
-
-    add_slide_number(slide, 4)
+        add_text(batch, x, Inches(6.1), Inches(2.8), Inches(0.8), sub, FONT_BODY, Pt(13), LIGHT, alignment=PP_ALIGN.CENTER)
 
 
-def slide_05_what_i_built(prs):
+@register_slide(images=[card[0] for card in BUILT_CARDS])
+def slide_05_what_i_built(slide, batch):
     """What I Built: Designing Everything from Scratch"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
     set_slide_bg(slide, NAVY)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(0.3), Inches(10), Inches(0.4))
-    set_text(tb.text_frame, "What I Built", size=Pt(20), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
-
-    tb = add_textbox(slide, Inches(0.8), Inches(0.8), Inches(11.5), Inches(0.7))
-    tf = tb.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    add_run(p, "Designing ", FONT_TITLE, Pt(34), WHITE, bold=True)
-    add_run(p, "Everything", FONT_TITLE, Pt(34), GOLD, bold=True)
-    add_run(p, " from Scratch", FONT_TITLE, Pt(34), WHITE, bold=True)
-
-    cards = [
-        ("s5-curriculum.png", "Leadership Curriculum", "Transformational, democratic, adaptive & collaborative leadership workshops with case studies", GOLD),
-        ("s5-assessment.png", "Assessment Tools", "Leadership questionnaire & activity interest survey to measure growth and guide programming", TEAL),
-        ("s5-events.png", "Events & Workshops", "2 leadership workshops, 2 ice breaker events, plus full Spring 2026 programming calendar", CORAL),
-        ("s5-outreach.png", "Outreach Materials", "Healthy Futures flyer, program poster, promotional materials for recruitment & community partners", BLUE_ACC),
-    ]
-    for i, (img_file, title, desc, color) in enumerate(cards):
+    add_text(batch, Inches(0.8), Inches(0.3), Inches(10), Inches(0.4), "What I Built", size=Pt(20), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
+
+    add_textbox(batch, Inches(0.8), Inches(0.8), Inches(11.5), Inches(0.7), [paragraph_xml([
+        run("Designing ", FONT_TITLE, Pt(34), WHITE, bold=True),
+        run("Everything", FONT_TITLE, Pt(34), GOLD, bold=True),
+        run(" from Scratch", FONT_TITLE, Pt(34), WHITE, bold=True),
+    ], PP_ALIGN.CENTER)], wrap=False)
+
+    for i, (img_file, title, desc, color) in enumerate(BUILT_CARDS):
         x = Inches(0.5 + i * 3.15)
         # Card background
-        add_card_bg(slide, x, Inches(1.8), Inches(2.9), Inches(5.3), color)
+        add_card_bg(batch, x, Inches(1.8), Inches(2.9), Inches(5.3), color)
         # Image
-        add_image_safe(slide, os.path.join(IMG, img_file), x + Inches(0.1), Inches(1.9), width=Inches(2.7))
+        add_image_safe(batch, os.path.join(IMG, img_file), x + Inches(0.1), Inches(1.9), width=Inches(2.7))
         # Title
-        tb = add_textbox(slide, x + Inches(0.15), Inches(4.7), Inches(2.6), Inches(0.5))
-        set_text(tb.text_frame, title, FONT_BODY, Pt(16), color, bold=True)
+        add_text(batch, x + Inches(0.15), Inches(4.7), Inches(2.6), Inches(0.5), title, FONT_BODY, Pt(16), color, bold=True)
         # Description
-        tb = add_textbox(slide, x + Inches(0.15), Inches(5.2), Inches(2.6), Inches(1.5))
-        set_text(tb.text_frame, desc, size=Pt(13), color=LIGHT)
+        add_text(batch, x + Inches(0.15), Inches(5.2), Inches(2.6), Inches(1.5), desc, size=Pt(13), color=LIGHT)
 
-    add_slide_number(slide, 5)
 
-
-def slide_06_timeline(prs):
+@register_slide(images=[phase[0] for phase in TIMELINE_PHASES])
+def slide_06_timeline(slide, batch):
     """Program Timeline"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
     set_slide_bg(slide, BLUE)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(0.3), Inches(11), Inches(0.4))
-    set_text(tb.text_frame, "The Journey", size=Pt(20), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(0.8), Inches(0.3), Inches(11), Inches(0.4), "The Journey", size=Pt(20), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(0.7), Inches(11), Inches(0.7))
-    tf = tb.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    add_run(p, "Program ", FONT_TITLE, Pt(34), WHITE, bold=True)
-    add_run(p, "Timeline", FONT_TITLE, Pt(34), GOLD, bold=True)
+    add_textbox(batch, Inches(0.8), Inches(0.7), Inches(11), Inches(0.7), [paragraph_xml([
+        run("Program ", FONT_TITLE, Pt(34), WHITE, bold=True),
+        run("Timeline", FONT_TITLE, Pt(34), GOLD, bold=True),
+    ], PP_ALIGN.CENTER)], wrap=False)
 
     # Timeline track
-    track = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(0.8), Inches(1.8), Inches(11.5), Pt(6))
-    track.fill.solid()
-    track.fill.fore_color.rgb = TEAL
-    track.line.fill.background()
-
-    phases = [
-        ("s6-foundation.png", "Foundation", "Fall 2025", "Grant Secured\nProgram Design\nRecruitment", GOLD),
-        ("s6-launch.png", "Launch", "Nov 2025", "Ice Breaker Events\nTeam Building\n20-30 Ambassadors", TEAL),
-        ("s6-workshops.png", "Workshops", "Nov-Dec 2025", "Leadership Training\nTransformational\nLeadership Focus", CORAL),
-        ("s6-growth.png", "Growth", "Spring 2026", "Simulation Field Trip\nMentorship Training\nInterest Surveys", BLUE_ACC),
-        ("s6-future.png", "Future", "2026+", "Community Outreach\nLeaders Symposium\nHealthy Futures", WHITE),
-    ]
-    for i, (img_file, phase, date, detail, color) in enumerate(phases):
+    emit(batch, shape_xml("rect", Inches(0.8), Inches(1.8), Inches(11.5), Pt(6), fill=TEAL))
+    for i, (img_file, phase, date, detail, color) in enumerate(TIMELINE_PHASES):
         x = Inches(0.5 + i * 2.5)
         # Dot
-        dot = slide.shapes.add_shape(MSO_SHAPE.OVAL, x + Inches(0.9), Inches(1.65), Inches(0.25), Inches(0.25))
-        dot.fill.solid()
-        dot.fill.fore_color.rgb = color
-        dot.line.fill.background()
+        emit(batch, shape_xml("ellipse", x + Inches(0.9), Inches(1.65), Inches(0.25), Inches(0.25), fill=color))
         # Image
-        add_image_safe(slide, os.path.join(IMG, img_file), x + Inches(0.2), Inches(2.1), width=Inches(1.6))
+        add_image_safe(batch, os.path.join(IMG, img_file), x + Inches(0.2), Inches(2.1), width=Inches(1.6))
         # Phase label
-        tb = add_textbox(slide, x, Inches(4.2), Inches(2.2), Inches(0.4))
-        set_text(tb.text_frame, phase, FONT_BODY, Pt(16), color, bold=True, alignment=PP_ALIGN.CENTER)
+        add_text(batch, x, Inches(4.2), Inches(2.2), Inches(0.4), phase, FONT_BODY, Pt(16), color, bold=True, alignment=PP_ALIGN.CENTER)
         # Date
-        tb = add_textbox(slide, x, Inches(4.6), Inches(2.2), Inches(0.3))
-        set_text(tb.text_frame, date, size=Pt(13), color=DIM, alignment=PP_ALIGN.CENTER)
+        add_text(batch, x, Inches(4.6), Inches(2.2), Inches(0.3), date, size=Pt(13), color=DIM, alignment=PP_ALIGN.CENTER)
         # Detail
-        tb = add_textbox(slide, x, Inches(5.0), Inches(2.2), Inches(1.5))
-        set_text(tb.text_frame, detail, size=Pt(13), color=LIGHT, alignment=PP_ALIGN.CENTER)
+        add_text(batch, x, Inches(5.0), Inches(2.2), Inches(1.5), detail, size=Pt(13), color=LIGHT, alignment=PP_ALIGN.CENTER)
 
-    add_slide_number(slide, 6)
 
-
-def slide_07_workshop1(prs):
+@register_slide(images=WS1_IMAGES)
+def slide_07_workshop1(slide, batch):
     """Workshop 1: Leadership & Communication Skills"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
     set_slide_bg(slide, NAVY)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(0.5), Inches(5), Inches(0.4))
-    set_text(tb.text_frame, "Workshop 1, November 18, 2025", size=Pt(18), color=GOLD, bold=True)
+    add_text(batch, Inches(0.8), Inches(0.5), Inches(5), Inches(0.4), "Workshop 1, November 18, 2025", size=Pt(18), color=GOLD, bold=True)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(1.0), Inches(5.5), Inches(1.2))
-    tf = tb.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    add_run(p, "Leadership &\n", FONT_TITLE, Pt(34), WHITE, bold=True)
-    add_run(p, "Communication Skills", FONT_TITLE, Pt(34), GOLD, bold=True)
+    add_textbox(batch, Inches(0.8), Inches(1.0), Inches(5.5), Inches(1.2), [paragraph_xml([
+        run("Leadership &\n", FONT_TITLE, Pt(34), WHITE, bold=True),
+        run("Communication Skills", FONT_TITLE, Pt(34), GOLD, bold=True),
+    ])])
 
-    add_accent_line(slide, Inches(0.8), Inches(2.5))
+    add_accent_line(batch, Inches(0.8), Inches(2.5))
 
-    tb = add_textbox(slide, Inches(0.8), Inches(2.8), Inches(5), Inches(2.5))
-    set_text(tb.text_frame,
+    add_text(batch, Inches(0.8), Inches(2.8), Inches(5), Inches(2.5),
         "My first workshop ever, designed from scratch. Introduced different leadership styles through real world case studies, group discussions, and interactive activities to build communication skills.",
         size=Pt(17), color=LIGHT)
 
     # Workshop images 2x2
-    ws1_imgs = ["ws1-01.png", "ws1-03.png", "ws1-05.png", "ws1-09.png"]
     positions = [(Inches(7.0), Inches(0.5)), (Inches(10.0), Inches(0.5)),
                  (Inches(7.0), Inches(3.7)), (Inches(10.0), Inches(3.7))]
-    for img_f, (x, y) in zip(ws1_imgs, positions):
-        add_image_safe(slide, os.path.join(IMG, img_f), x, y, width=Inches(2.8))
-
-    tb = add_textbox(slide, Inches(7.0), Inches(7.0), Inches(5.8), Inches(0.3))
-    set_text(tb.text_frame, "Actual slides from Workshop 1", size=Pt(11), color=DIM, italic=True, alignment=PP_ALIGN.CENTER)
+    for img_f, (x, y) in zip(WS1_IMAGES, positions):
+        add_image_safe(batch, os.path.join(IMG, img_f), x, y, Inches(2.8), Inches(1.575), fit="contain")
 
-    add_slide_number(slide, 7)
+    add_text(batch, Inches(7.0), Inches(7.0), Inches(5.8), Inches(0.3), "Actual slides from Workshop 1", size=Pt(11), color=DIM, italic=True, alignment=PP_ALIGN.CENTER)
 
 
-def slide_08_evolution(prs):
+@register_slide
+def slide_08_evolution(slide, batch):
     """What I Learned & Changed"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
     set_gradient_bg(slide, NAVY, RGBColor(0x1A, 0x4A, 0x42))
 
-    tb = add_textbox(slide, Inches(0.8), Inches(0.3), Inches(11), Inches(0.4))
-    set_text(tb.text_frame, "My Growth as a Facilitator", size=Pt(20), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(0.8), Inches(0.3), Inches(11), Inches(0.4), "My Growth as a Facilitator", size=Pt(20), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(0.7), Inches(11), Inches(0.7))
-    tf = tb.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    add_run(p, "What I ", FONT_TITLE, Pt(34), WHITE, bold=True)
-    add_run(p, "Learned", FONT_TITLE, Pt(34), GOLD, bold=True)
-    add_run(p, " & Changed", FONT_TITLE, Pt(34), WHITE, bold=True)
+    add_textbox(batch, Inches(0.8), Inches(0.7), Inches(11), Inches(0.7), [paragraph_xml([
+        run("What I ", FONT_TITLE, Pt(34), WHITE, bold=True),
+        run("Learned", FONT_TITLE, Pt(34), GOLD, bold=True),
+        run(" & Changed", FONT_TITLE, Pt(34), WHITE, bold=True),
+    ], PP_ALIGN.CENTER)], wrap=False)
 
     # Left column: What I noticed
-    tb = add_textbox(slide, Inches(0.8), Inches(1.7), Inches(5.5), Inches(0.4))
-    set_text(tb.text_frame, "After Workshop 1, I noticed...", FONT_BODY, Pt(18), CORAL, bold=True)
+    add_text(batch, Inches(0.8), Inches(1.7), Inches(5.5), Inches(0.4), "After Workshop 1, I noticed...", FONT_BODY, Pt(18), CORAL, bold=True)
 
     noticed = [
         "📝 Too much content delivery, not enough student interaction",
@@ -523,12 +435,10 @@ def slide_08_evolution(prs):
         "⏱ Pacing felt rushed, needed to slow down and listen",
     ]
     for i, item in enumerate(noticed):
-        tb = add_textbox(slide, Inches(0.8), Inches(2.3 + i * 0.9), Inches(5.5), Inches(0.8))
-        set_text(tb.text_frame, item, size=Pt(16), color=LIGHT)
+        add_text(batch, Inches(0.8), Inches(2.3 + i * 0.9), Inches(5.5), Inches(0.8), item, size=Pt(16), color=LIGHT)
 
     # Right column: What I changed
-    tb = add_textbox(slide, Inches(7.0), Inches(1.7), Inches(5.5), Inches(0.4))
-    set_text(tb.text_frame, "So for Workshop 2, I...", FONT_BODY, Pt(18), TEAL, bold=True)
+    add_text(batch, Inches(7.0), Inches(1.7), Inches(5.5), Inches(0.4), "So for Workshop 2, I...", FONT_BODY, Pt(18), TEAL, bold=True)
 
     changed = [
         "📊 Added a post-survey to capture feedback in real time",
@@ -536,82 +446,61 @@ def slide_08_evolution(prs):
         "🎓 Co-facilitated with Dr. Clifford, learned from watching her lead",
     ]
     for i, item in enumerate(changed):
-        tb = add_textbox(slide, Inches(7.0), Inches(2.3 + i * 0.9), Inches(5.5), Inches(0.8))
-        set_text(tb.text_frame, item, size=Pt(16), color=LIGHT)
+        add_text(batch, Inches(7.0), Inches(2.3 + i * 0.9), Inches(5.5), Inches(0.8), item, size=Pt(16), color=LIGHT)
 
     # Evolution arrow bar
-    bar_bg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(1.5), Inches(5.5), Inches(10), Pt(6))
-    bar_bg.fill.solid()
-    bar_bg.fill.fore_color.rgb = TEAL
-    bar_bg.line.fill.background()
-
-    tb = add_textbox(slide, Inches(0.8), Inches(5.7), Inches(3), Inches(0.4))
-    set_text(tb.text_frame, "Content Heavy", size=Pt(14), color=CORAL, bold=True)
+    emit(batch, shape_xml("rect", Inches(1.5), Inches(5.5), Inches(10), Pt(6), fill=TEAL))
 
-    tb = add_textbox(slide, Inches(4.5), Inches(5.7), Inches(4), Inches(0.4))
-    set_text(tb.text_frame, "Listen first, then redesign", size=Pt(14), color=DIM, italic=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(0.8), Inches(5.7), Inches(3), Inches(0.4), "Content Heavy", size=Pt(14), color=CORAL, bold=True)
 
-    tb = add_textbox(slide, Inches(9.5), Inches(5.7), Inches(3), Inches(0.4))
-    set_text(tb.text_frame, "Student Centered", size=Pt(14), color=TEAL, bold=True, alignment=PP_ALIGN.RIGHT)
+    add_text(batch, Inches(4.5), Inches(5.7), Inches(4), Inches(0.4), "Listen first, then redesign", size=Pt(14), color=DIM, italic=True, alignment=PP_ALIGN.CENTER)
 
-    add_slide_number(slide, 8)
+    add_text(batch, Inches(9.5), Inches(5.7), Inches(3), Inches(0.4), "Student Centered", size=Pt(14), color=TEAL, bold=True, alignment=PP_ALIGN.RIGHT)
 
 
-def slide_09_workshop2(prs):
+@register_slide(images=WS2_IMAGES)
+def slide_09_workshop2(slide, batch):
     """Workshop 2: Transformational Leadership"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
     set_slide_bg(slide, NAVY)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(0.5), Inches(5), Inches(0.4))
-    set_text(tb.text_frame, "Workshop 2, December 2, 2025", size=Pt(18), color=GOLD, bold=True)
+    add_text(batch, Inches(0.8), Inches(0.5), Inches(5), Inches(0.4), "Workshop 2, December 2, 2025", size=Pt(18), color=GOLD, bold=True)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(1.0), Inches(5.5), Inches(1.2))
-    tf = tb.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    add_run(p, "Transformational\n", FONT_TITLE, Pt(34), WHITE, bold=True)
-    add_run(p, "Leadership", FONT_TITLE, Pt(34), GOLD, bold=True)
+    add_textbox(batch, Inches(0.8), Inches(1.0), Inches(5.5), Inches(1.2), [paragraph_xml([
+        run("Transformational\n", FONT_TITLE, Pt(34), WHITE, bold=True),
+        run("Leadership", FONT_TITLE, Pt(34), GOLD, bold=True),
+    ])])
 
-    add_accent_line(slide, Inches(0.8), Inches(2.5))
+    add_accent_line(batch, Inches(0.8), Inches(2.5))
 
-    tb = add_textbox(slide, Inches(0.8), Inches(2.8), Inches(5), Inches(2.5))
-    tf = tb.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    add_run(p, "A redesigned, discussion-driven workshop. Started with Simon Sinek's ", FONT_BODY, Pt(17), LIGHT)
-    add_run(p, '"Start With Why"', FONT_BODY, Pt(17), GOLD, bold=True)
-    add_run(p, ", asked students to reflect on their own why, and explored team dynamics through Patrick Lencioni's ", FONT_BODY, Pt(17), LIGHT)
-    add_run(p, "Five Dysfunctions of a Team", FONT_BODY, Pt(17), WHITE, bold=True)
-    add_run(p, ".", FONT_BODY, Pt(17), LIGHT)
+    add_textbox(batch, Inches(0.8), Inches(2.8), Inches(5), Inches(2.5), [paragraph_xml([
+        run("A redesigned, discussion-driven workshop. Started with Simon Sinek's ", FONT_BODY, Pt(17), LIGHT),
+        run('"Start With Why"', FONT_BODY, Pt(17), GOLD, bold=True),
+        run(", asked students to reflect on their own why, and explored team dynamics through Patrick Lencioni's ", FONT_BODY, Pt(17), LIGHT),
+        run("Five Dysfunctions of a Team", FONT_BODY, Pt(17), WHITE, bold=True),
+        run(".", FONT_BODY, Pt(17), LIGHT),
+    ])])
 
     # Workshop images 2x2
-    ws2_imgs = ["ws2-01.png", "ws2-03.png", "ws2-04.png", "ws2-11.png"]
     positions = [(Inches(7.0), Inches(0.5)), (Inches(10.0), Inches(0.5)),
                  (Inches(7.0), Inches(3.7)), (Inches(10.0), Inches(3.7))]
-    for img_f, (x, y) in zip(ws2_imgs, positions):
-        add_image_safe(slide, os.path.join(IMG, img_f), x, y, width=Inches(2.8))
+    for img_f, (x, y) in zip(WS2_IMAGES, positions):
+        add_image_safe(batch, os.path.join(IMG, img_f), x, y, Inches(2.8), Inches(1.575), fit="contain")
 
-    tb = add_textbox(slide, Inches(7.0), Inches(7.0), Inches(5.8), Inches(0.3))
-    set_text(tb.text_frame, "Actual slides from Workshop 2", size=Pt(11), color=DIM, italic=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(7.0), Inches(7.0), Inches(5.8), Inches(0.3), "Actual slides from Workshop 2", size=Pt(11), color=DIM, italic=True, alignment=PP_ALIGN.CENTER)
 
-    add_slide_number(slide, 9)
 
-
-def slide_10_feedback(prs):
+@register_slide(images=[SURVEY_IMAGE])
+def slide_10_feedback(slide, batch):
     """Student Feedback"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
     set_slide_bg(slide, BLUE)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(0.3), Inches(11), Inches(0.4))
-    set_text(tb.text_frame, "In Their Own Words", size=Pt(20), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(0.8), Inches(0.3), Inches(11), Inches(0.4), "In Their Own Words", size=Pt(20), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(0.7), Inches(11), Inches(0.7))
-    tf = tb.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    add_run(p, "What the ", FONT_TITLE, Pt(34), WHITE, bold=True)
-    add_run(p, "Ambassadors", FONT_TITLE, Pt(34), GOLD, bold=True)
-    add_run(p, " Said", FONT_TITLE, Pt(34), WHITE, bold=True)
+    add_textbox(batch, Inches(0.8), Inches(0.7), Inches(11), Inches(0.7), [paragraph_xml([
+        run("What the ", FONT_TITLE, Pt(34), WHITE, bold=True),
+        run("Ambassadors", FONT_TITLE, Pt(34), GOLD, bold=True),
+        run(" Said", FONT_TITLE, Pt(34), WHITE, bold=True),
+    ], PP_ALIGN.CENTER)], wrap=False)
 
     # Quote cards
     quotes = [
@@ -622,54 +511,41 @@ def slide_10_feedback(prs):
     for i, (quote, attrib, color) in enumerate(quotes):
         y = Inches(1.6 + i * 1.8)
         # Card bg
-        card = add_card_bg(slide, Inches(0.6), y, Inches(6.2), Inches(1.6), color)
+        add_card_bg(batch, Inches(0.6), y, Inches(6.2), Inches(1.6), color)
         # Quote text
-        tb = add_textbox(slide, Inches(0.8), y + Inches(0.1), Inches(5.8), Inches(1.1))
-        set_text(tb.text_frame, quote, size=Pt(14), color=WHITE, italic=True)
+        add_text(batch, Inches(0.8), y + Inches(0.1), Inches(5.8), Inches(1.1), quote, size=Pt(14), color=WHITE, italic=True)
         # Attribution
-        tb = add_textbox(slide, Inches(0.8), y + Inches(1.2), Inches(5.8), Inches(0.3))
-        set_text(tb.text_frame, f"— {attrib}", size=Pt(12), color=color)
+        add_text(batch, Inches(0.8), y + Inches(1.2), Inches(5.8), Inches(0.3), f"— {attrib}", size=Pt(12), color=color)
 
     # Survey image
-    add_image_safe(slide, os.path.join(IMG, "survey-3.png"), Inches(7.2), Inches(1.8), width=Inches(5.5))
+    add_image_safe(batch, os.path.join(IMG, SURVEY_IMAGE), Inches(7.2), Inches(1.8), width=Inches(5.5))
 
-    tb = add_textbox(slide, Inches(7.2), Inches(5.5), Inches(5.5), Inches(0.3))
-    set_text(tb.text_frame, "Activity Interest Survey Results (3 responses)", size=Pt(11), color=DIM, italic=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(7.2), Inches(5.5), Inches(5.5), Inches(0.3), "Activity Interest Survey Results (3 responses)", size=Pt(11), color=DIM, italic=True, alignment=PP_ALIGN.CENTER)
 
     # Highlight box
-    highlight_bg = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(7.5), Inches(6.0), Inches(5.0), Inches(1.0))
-    highlight_bg.fill.solid()
-    highlight_bg.fill.fore_color.rgb = RGBColor(0x1E, 0x2A, 0x3F)
-    highlight_bg.line.color.rgb = GOLD
-    highlight_bg.line.width = Pt(1)
-
-    tb = add_textbox(slide, Inches(7.6), Inches(6.1), Inches(4.8), Inches(0.4))
-    set_text(tb.text_frame, "Leadership & Communication: 100% interest", size=Pt(15), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
+    emit(batch, shape_xml("roundRect", Inches(7.5), Inches(6.0), Inches(5.0), Inches(1.0),
+                          fill=RGBColor(0x1E, 0x2A, 0x3F), line=GOLD, line_width=Pt(1)))
 
-    tb = add_textbox(slide, Inches(7.6), Inches(6.5), Inches(4.8), Inches(0.3))
-    set_text(tb.text_frame, "Students want practical, interactive experiences", size=Pt(13), color=DIM, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(7.6), Inches(6.1), Inches(4.8), Inches(0.4), "Leadership & Communication: 100% interest", size=Pt(15), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
 
-    add_slide_number(slide, 10)
+    add_text(batch, Inches(7.6), Inches(6.5), Inches(4.8), Inches(0.3), "Students want practical, interactive experiences", size=Pt(13), color=DIM, alignment=PP_ALIGN.CENTER)
 
 
-def slide_11_challenges(prs):
+@register_slide(images=[CHALLENGES_IMAGE])
+def slide_11_challenges(slide, batch):
     """Challenges"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
     set_gradient_bg(slide, BLUE, RGBColor(0x4A, 0x2C, 0x2A))
 
     # Left side
-    tb = add_textbox(slide, Inches(0.5), Inches(0.5), Inches(5.5), Inches(0.4))
-    set_text(tb.text_frame, "Real Talk", size=Pt(20), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(0.5), Inches(0.5), Inches(5.5), Inches(0.4), "Real Talk", size=Pt(20), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
 
-    tb = add_textbox(slide, Inches(0.5), Inches(1.0), Inches(5.5), Inches(1.2))
-    tf = tb.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    add_run(p, "The ", FONT_TITLE, Pt(34), WHITE, bold=True)
-    add_run(p, "Challenges", FONT_TITLE, Pt(34), CORAL, bold=True)
-    add_run(p, "\nNobody Warns You About", FONT_TITLE, Pt(34), WHITE, bold=True)
+    add_textbox(batch, Inches(0.5), Inches(1.0), Inches(5.5), Inches(1.2), [paragraph_xml([
+        run("The ", FONT_TITLE, Pt(34), WHITE, bold=True),
+        run("Challenges", FONT_TITLE, Pt(34), CORAL, bold=True),
+        run("\nNobody Warns You About", FONT_TITLE, Pt(34), WHITE, bold=True),
+    ], PP_ALIGN.CENTER)], wrap=False)
 
-    add_image_safe(slide, os.path.join(IMG, "s11-challenges.png"), Inches(1.0), Inches(2.8), height=Inches(4.0))
+    add_image_safe(batch, os.path.join(IMG, CHALLENGES_IMAGE), Inches(1.0), Inches(2.8), height=Inches(4.0))
 
     # Right side: challenge cards
     challenges = [
@@ -679,128 +555,96 @@ def slide_11_challenges(prs):
     ]
     for i, (title, desc, color) in enumerate(challenges):
         y = Inches(0.8 + i * 2.2)
-        card = add_card_bg(slide, Inches(6.8), y, Inches(5.8), Inches(2.0), color)
-        tb = add_textbox(slide, Inches(7.0), y + Inches(0.15), Inches(5.4), Inches(0.4))
-        set_text(tb.text_frame, title, FONT_BODY, Pt(16), color, bold=True)
-        tb = add_textbox(slide, Inches(7.0), y + Inches(0.6), Inches(5.4), Inches(1.2))
-        set_text(tb.text_frame, desc, size=Pt(14), color=LIGHT)
+        add_card_bg(batch, Inches(6.8), y, Inches(5.8), Inches(2.0), color)
+        add_text(batch, Inches(7.0), y + Inches(0.15), Inches(5.4), Inches(0.4), title, FONT_BODY, Pt(16), color, bold=True)
+        add_text(batch, Inches(7.0), y + Inches(0.6), Inches(5.4), Inches(1.2), desc, size=Pt(14), color=LIGHT)
 
-    add_slide_number(slide, 11)
 
-
-def slide_12_breakthrough(prs):
+@register_slide(images=[BREAKTHROUGH_IMAGE, CASE_STUDY_IMAGE, PURPOSE_IMAGE])
+def slide_12_breakthrough(slide, batch):
     """Breakthrough Moment"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
     set_slide_bg(slide, NAVY)
 
     # Left side
-    tb = add_textbox(slide, Inches(0.5), Inches(0.5), Inches(5.5), Inches(0.4))
-    set_text(tb.text_frame, "The Turning Point", size=Pt(20), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(0.5), Inches(0.5), Inches(5.5), Inches(0.4), "The Turning Point", size=Pt(20), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
 
-    tb = add_textbox(slide, Inches(0.5), Inches(1.0), Inches(5.5), Inches(0.8))
-    tf = tb.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    add_run(p, "When It All ", FONT_TITLE, Pt(34), WHITE, bold=True)
-    add_run(p, "Clicked", FONT_TITLE, Pt(34), GOLD, bold=True)
+    add_textbox(batch, Inches(0.5), Inches(1.0), Inches(5.5), Inches(0.8), [paragraph_xml([
+        run("When It All ", FONT_TITLE, Pt(34), WHITE, bold=True),
+        run("Clicked", FONT_TITLE, Pt(34), GOLD, bold=True),
+    ], PP_ALIGN.CENTER)], wrap=False)
 
-    add_image_safe(slide, os.path.join(IMG, "s12-breakthrough.png"), Inches(1.0), Inches(2.2), height=Inches(4.5))
+    add_image_safe(batch, os.path.join(IMG, BREAKTHROUGH_IMAGE), Inches(1.0), Inches(2.2), height=Inches(4.5))
 
     # Right side
     # Quote
-    quote_bg = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(6.8), Inches(0.6), Inches(5.8), Inches(1.6))
-    quote_bg.fill.solid()
-    quote_bg.fill.fore_color.rgb = RGBColor(0x1A, 0x25, 0x38)
-    quote_bg.line.fill.background()
-    border = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, Inches(6.8), Inches(0.6), Pt(4), Inches(1.6))
-    border.fill.solid()
-    border.fill.fore_color.rgb = GOLD
-    border.line.fill.background()
-    tb = add_textbox(slide, Inches(7.0), Inches(0.7), Inches(5.4), Inches(1.4))
-    set_text(tb.text_frame, "The students were engaged from the start, in both workshops. What really changed was me. By the second workshop, I stopped anticipating their answers. I stopped planning how to respond before they finished speaking.", size=Pt(15), color=WHITE, italic=True)
-
-    tb = add_textbox(slide, Inches(6.8), Inches(2.5), Inches(5.8), Inches(1.2))
-    tf = tb.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    add_run(p, "I learned to ", FONT_BODY, Pt(16), LIGHT)
-    add_run(p, "truly listen", FONT_BODY, Pt(16), GOLD, bold=True)
-    add_run(p, ", to be present in the moment, and to let the conversation flow naturally instead of controlling it.", FONT_BODY, Pt(16), LIGHT)
-
-    tb = add_textbox(slide, Inches(6.8), Inches(3.7), Inches(5.8), Inches(1.0))
-    set_text(tb.text_frame, "That shift made all the difference. I became more engaged, more curious, and more connected to the students I was serving.", size=Pt(16), color=LIGHT)
+    emit(batch, shape_xml("rect", Inches(6.8), Inches(0.6), Inches(5.8), Inches(1.6), fill=RGBColor(0x1A, 0x25, 0x38)))
+    emit(batch, shape_xml("rect", Inches(6.8), Inches(0.6), Pt(4), Inches(1.6), fill=GOLD))
+    add_text(batch, Inches(7.0), Inches(0.7), Inches(5.4), Inches(1.4), "The students were engaged from the start, in both workshops. What really changed was me. By the second workshop, I stopped anticipating their answers. I stopped planning how to respond before they finished speaking.", size=Pt(15), color=WHITE, italic=True)
 
-    # Bottom images
-    add_image_safe(slide, os.path.join(IMG, "ws2-09.png"), Inches(6.8), Inches(4.9), width=Inches(2.8))
-    add_image_safe(slide, os.path.join(IMG, "ws2-10.png"), Inches(9.8), Inches(4.9), width=Inches(2.8))
+    add_textbox(batch, Inches(6.8), Inches(2.5), Inches(5.8), Inches(1.2), [paragraph_xml([
+        run("I learned to ", FONT_BODY, Pt(16), LIGHT),
+        run("truly listen", FONT_BODY, Pt(16), GOLD, bold=True),
+        run(", to be present in the moment, and to let the conversation flow naturally instead of controlling it.", FONT_BODY, Pt(16), LIGHT),
+    ])])
 
-    tb = add_textbox(slide, Inches(6.8), Inches(7.0), Inches(5.8), Inches(0.3))
-    set_text(tb.text_frame, "Case study slides that sparked real debate", size=Pt(11), color=DIM, italic=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(6.8), Inches(3.7), Inches(5.8), Inches(1.0), "That shift made all the difference. I became more engaged, more curious, and more connected to the students I was serving.", size=Pt(16), color=LIGHT)
 
-    add_slide_number(slide, 12)
+    # Bottom images
+    add_image_safe(batch, os.path.join(IMG, CASE_STUDY_IMAGE), Inches(6.8), Inches(4.9), width=Inches(2.8))
+    add_image_safe(batch, os.path.join(IMG, PURPOSE_IMAGE), Inches(9.8), Inches(4.9), width=Inches(2.8))
 
+    add_text(batch, Inches(6.8), Inches(7.0), Inches(5.8), Inches(0.3), "Case study slides that sparked real debate", size=Pt(11), color=DIM, italic=True, alignment=PP_ALIGN.CENTER)
 
-def slide_13_impact(prs):
+
+@register_slide
+def slide_13_impact(slide, batch):
     """Impact & Numbers"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
     set_gradient_bg(slide, NAVY, RGBColor(0x1A, 0x4A, 0x42))
 
-    tb = add_textbox(slide, Inches(0.8), Inches(0.3), Inches(11), Inches(0.4))
-    set_text(tb.text_frame, "Impact So Far", size=Pt(20), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(0.8), Inches(0.3), Inches(11), Inches(0.4), "Impact So Far", size=Pt(20), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(0.7), Inches(11), Inches(0.7))
-    tf = tb.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    add_run(p, "By the ", FONT_TITLE, Pt(34), WHITE, bold=True)
-    add_run(p, "Numbers", FONT_TITLE, Pt(34), GOLD, bold=True)
+    add_textbox(batch, Inches(0.8), Inches(0.7), Inches(11), Inches(0.7), [paragraph_xml([
+        run("By the ", FONT_TITLE, Pt(34), WHITE, bold=True),
+        run("Numbers", FONT_TITLE, Pt(34), GOLD, bold=True),
+    ], PP_ALIGN.CENTER)], wrap=False)
 
+    impact, _ = read_impact()
     stats = [
-        ("20", "Undergraduate\nAmbassadors", GOLD),
-        ("4", "Events\nCompleted", TEAL),
-        ("4", "Leadership Styles\nTaught", CORAL),
-        ("$10K", "Diversity Innovation\nGrant Secured", BLUE_ACC),
+        (str(impact["ambassadors"]), "Undergraduate\nAmbassadors", GOLD),
+        (str(impact["events"]), "Events\nCompleted", TEAL),
+        (str(impact["styles"]), "Leadership Styles\nTaught", CORAL),
+        (f"${impact['grant_k']}K", "Diversity Innovation\nGrant Secured", BLUE_ACC),
     ]
     for i, (number, label, color) in enumerate(stats):
         x = Inches(0.8 + i * 3.1)
         # Card bg
-        card = add_card_bg(slide, x, Inches(1.8), Inches(2.8), Inches(3.5), color)
+        add_card_bg(batch, x, Inches(1.8), Inches(2.8), Inches(3.5), color)
         # Number
-        tb = add_textbox(slide, x, Inches(2.0), Inches(2.8), Inches(1.5))
-        set_text(tb.text_frame, number, FONT_TITLE, Pt(64), color, bold=True, alignment=PP_ALIGN.CENTER)
+        add_text(batch, x, Inches(2.0), Inches(2.8), Inches(1.5), number, FONT_TITLE, Pt(64), color, bold=True, alignment=PP_ALIGN.CENTER)
         # Label
-        tb = add_textbox(slide, x, Inches(3.5), Inches(2.8), Inches(1.0))
-        set_text(tb.text_frame, label, FONT_BODY, Pt(16), LIGHT, bold=True, alignment=PP_ALIGN.CENTER)
+        add_text(batch, x, Inches(3.5), Inches(2.8), Inches(1.0), label, FONT_BODY, Pt(16), LIGHT, bold=True, alignment=PP_ALIGN.CENTER)
 
     # Bottom text
-    tb = add_textbox(slide, Inches(1.0), Inches(5.8), Inches(11), Inches(0.8))
-    tf = tb.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    add_run(p, "Connected to the ", FONT_BODY, Pt(17), LIGHT)
-    add_run(p, "Healthy Futures Initiative", FONT_BODY, Pt(17), GOLD, bold=True)
-    add_run(p, ", building pathways for underserved communities into health professions", FONT_BODY, Pt(17), LIGHT)
-
-    add_slide_number(slide, 13)
+    add_textbox(batch, Inches(1.0), Inches(5.8), Inches(11), Inches(0.8), [paragraph_xml([
+        run("Connected to the ", FONT_BODY, Pt(17), LIGHT),
+        run("Healthy Futures Initiative", FONT_BODY, Pt(17), GOLD, bold=True),
+        run(", building pathways for underserved communities into health professions", FONT_BODY, Pt(17), LIGHT),
+    ], PP_ALIGN.CENTER)])
 
 
-def slide_14_whats_next(prs):
+@register_slide
+def slide_14_whats_next(slide, batch):
     """Spring 2026 & Beyond"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
     set_slide_bg(slide, BLUE)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(0.5), Inches(5.5), Inches(0.4))
-    set_text(tb.text_frame, "Looking Ahead", size=Pt(20), color=GOLD, bold=True)
+    add_text(batch, Inches(0.8), Inches(0.5), Inches(5.5), Inches(0.4), "Looking Ahead", size=Pt(20), color=GOLD, bold=True)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(1.0), Inches(5.5), Inches(1.0))
-    tf = tb.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    add_run(p, "Spring 2026\n& ", FONT_TITLE, Pt(36), WHITE, bold=True)
-    add_run(p, "Beyond", FONT_TITLE, Pt(36), GOLD, bold=True)
+    add_textbox(batch, Inches(0.8), Inches(1.0), Inches(5.5), Inches(1.0), [paragraph_xml([
+        run("Spring 2026\n& ", FONT_TITLE, Pt(36), WHITE, bold=True),
+        run("Beyond", FONT_TITLE, Pt(36), GOLD, bold=True),
+    ])])
 
-    add_accent_line(slide, Inches(0.8), Inches(2.3))
+    add_accent_line(batch, Inches(0.8), Inches(2.3))
 
     items = [
         ("Simulation Field Trip", "Grunin Center hands-on experience in Nursing, PA, OT, AT, PT"),
@@ -808,15 +652,11 @@ def slide_14_whats_next(prs):
         ("Future Leaders Symposium", "Full day mini-conference with certificates"),
         ("Community Outreach", "Connecting with local schools through Healthy Futures"),
     ]
-    tb = add_textbox(slide, Inches(0.8), Inches(2.6), Inches(5.5), Inches(4.5))
-    tf = tb.text_frame
-    tf.word_wrap = True
-    for i, (bold_part, rest) in enumerate(items):
-        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
-        p.space_before = Pt(10)
-        add_run(p, "● ", FONT_BODY, Pt(17), GOLD)
-        add_run(p, bold_part, FONT_BODY, Pt(17), WHITE, bold=True)
-        add_run(p, f" — {rest}", FONT_BODY, Pt(17), LIGHT)
+    add_textbox(batch, Inches(0.8), Inches(2.6), Inches(5.5), Inches(4.5), [paragraph_xml([
+        run("● ", FONT_BODY, Pt(17), GOLD),
+        run(bold_part, FONT_BODY, Pt(17), WHITE, bold=True),
+        run(f" — {rest}", FONT_BODY, Pt(17), LIGHT),
+    ], space_before=Pt(10)) for bold_part, rest in items])
 
     # Right side: growth trajectory as text steps
     steps = [
@@ -830,41 +670,29 @@ def slide_14_whats_next(prs):
         x = Inches(7.5)
         y = Inches(1.0 + i * 1.2)
         # Step circle
-        circle = slide.shapes.add_shape(MSO_SHAPE.OVAL, x, y + Inches(0.05), Inches(0.4), Inches(0.4))
-        circle.fill.solid()
-        circle.fill.fore_color.rgb = color
-        circle.line.color.rgb = WHITE
-        circle.line.width = Pt(2)
+        emit(batch, shape_xml("ellipse", x, y + Inches(0.05), Inches(0.4), Inches(0.4),
+                              fill=color, line=WHITE, line_width=Pt(2)))
         # Connector line (not for last)
         if i < len(steps) - 1:
-            line = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, x + Inches(0.17), y + Inches(0.5), Pt(3), Inches(0.75))
-            line.fill.solid()
-            line.fill.fore_color.rgb = RGBColor(0x40, 0x50, 0x60)
-            line.line.fill.background()
+            emit(batch, shape_xml("rect", x + Inches(0.17), y + Inches(0.5), Pt(3), Inches(0.75),
+                                  fill=RGBColor(0x40, 0x50, 0x60)))
         # Label
-        tb = add_textbox(slide, x + Inches(0.6), y, Inches(4), Inches(0.5))
-        set_text(tb.text_frame, step_text, FONT_BODY, Pt(17), color, bold=True)
+        add_text(batch, x + Inches(0.6), y, Inches(4), Inches(0.5), step_text, FONT_BODY, Pt(17), color, bold=True)
 
-    tb = add_textbox(slide, Inches(7.5), Inches(6.8), Inches(4.5), Inches(0.3))
-    set_text(tb.text_frame, "Program Growth Trajectory", size=Pt(13), color=DIM, italic=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(7.5), Inches(6.8), Inches(4.5), Inches(0.3), "Program Growth Trajectory", size=Pt(13), color=DIM, italic=True, alignment=PP_ALIGN.CENTER)
 
-    add_slide_number(slide, 14)
 
-
-def slide_15_lessons(prs):
+@register_slide
+def slide_15_lessons(slide, batch):
     """Lessons Learned"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
     set_slide_bg(slide, NAVY)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(0.3), Inches(11), Inches(0.4))
-    set_text(tb.text_frame, "Lessons Learned", size=Pt(20), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(0.8), Inches(0.3), Inches(11), Inches(0.4), "Lessons Learned", size=Pt(20), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(0.7), Inches(11), Inches(0.7))
-    tf = tb.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    add_run(p, "What Building This Program ", FONT_TITLE, Pt(34), WHITE, bold=True)
-    add_run(p, "Taught Me", FONT_TITLE, Pt(34), GOLD, bold=True)
+    add_textbox(batch, Inches(0.8), Inches(0.7), Inches(11), Inches(0.7), [paragraph_xml([
+        run("What Building This Program ", FONT_TITLE, Pt(34), WHITE, bold=True),
+        run("Taught Me", FONT_TITLE, Pt(34), GOLD, bold=True),
+    ], PP_ALIGN.CENTER)], wrap=False)
 
     lessons = [
         ("Start With People", "Great programs aren't built on paper — they're built on relationships. Listen to your students first, design second.", GOLD),
@@ -873,31 +701,24 @@ def slide_15_lessons(prs):
     ]
     for i, (title, desc, color) in enumerate(lessons):
         x = Inches(0.6 + i * 4.1)
-        card = add_card_bg(slide, x, Inches(1.8), Inches(3.8), Inches(4.8), color)
+        add_card_bg(batch, x, Inches(1.8), Inches(3.8), Inches(4.8), color)
         # Title
-        tb = add_textbox(slide, x + Inches(0.2), Inches(2.2), Inches(3.4), Inches(0.6))
-        set_text(tb.text_frame, title, FONT_BODY, Pt(20), color, bold=True, alignment=PP_ALIGN.CENTER)
+        add_text(batch, x + Inches(0.2), Inches(2.2), Inches(3.4), Inches(0.6), title, FONT_BODY, Pt(20), color, bold=True, alignment=PP_ALIGN.CENTER)
         # Description
-        tb = add_textbox(slide, x + Inches(0.2), Inches(3.0), Inches(3.4), Inches(3.0))
-        set_text(tb.text_frame, desc, size=Pt(16), color=LIGHT, alignment=PP_ALIGN.CENTER)
-
-    add_slide_number(slide, 15)
+        add_text(batch, x + Inches(0.2), Inches(3.0), Inches(3.4), Inches(3.0), desc, size=Pt(16), color=LIGHT, alignment=PP_ALIGN.CENTER)
 
 
-def slide_16_thankyou(prs):
+@register_slide
+def slide_16_thankyou(slide, batch):
     """Thank You"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
     set_slide_bg(slide, NAVY)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(0.3), Inches(11), Inches(0.4))
-    set_text(tb.text_frame, "Gratitude", size=Pt(20), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(0.8), Inches(0.3), Inches(11), Inches(0.4), "Gratitude", size=Pt(20), color=GOLD, bold=True, alignment=PP_ALIGN.CENTER)
 
-    tb = add_textbox(slide, Inches(0.8), Inches(0.7), Inches(11), Inches(0.7))
-    tf = tb.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    add_run(p, "Thank ", FONT_TITLE, Pt(38), WHITE, bold=True)
-    add_run(p, "You", FONT_TITLE, Pt(38), GOLD, bold=True)
+    add_textbox(batch, Inches(0.8), Inches(0.7), Inches(11), Inches(0.7), [paragraph_xml([
+        run("Thank ", FONT_TITLE, Pt(38), WHITE, bold=True),
+        run("You", FONT_TITLE, Pt(38), GOLD, bold=True),
+    ], PP_ALIGN.CENTER)], wrap=False)
 
     thanks = [
         ("🎓", "Dr. Clifford", "Acting Dean & Mentor\nFor believing in the vision and guiding me every step", GOLD),
@@ -907,82 +728,94 @@ def slide_16_thankyou(prs):
     ]
     for i, (icon, name, desc, color) in enumerate(thanks):
         x = Inches(0.5 + i * 3.15)
-        card = add_card_bg(slide, x, Inches(1.8), Inches(2.9), Inches(4.2), color)
+        add_card_bg(batch, x, Inches(1.8), Inches(2.9), Inches(4.2), color)
         # Icon
-        tb = add_textbox(slide, x, Inches(2.0), Inches(2.9), Inches(0.6))
-        set_text(tb.text_frame, icon, size=Pt(32), alignment=PP_ALIGN.CENTER)
+        add_text(batch, x, Inches(2.0), Inches(2.9), Inches(0.6), icon, size=Pt(32), alignment=PP_ALIGN.CENTER)
         # Name
-        tb = add_textbox(slide, x + Inches(0.1), Inches(2.7), Inches(2.7), Inches(0.5))
-        set_text(tb.text_frame, name, FONT_BODY, Pt(17), color, bold=True, alignment=PP_ALIGN.CENTER)
+        add_text(batch, x + Inches(0.1), Inches(2.7), Inches(2.7), Inches(0.5), name, FONT_BODY, Pt(17), color, bold=True, alignment=PP_ALIGN.CENTER)
         # Description
-        tb = add_textbox(slide, x + Inches(0.1), Inches(3.3), Inches(2.7), Inches(2.2))
-        set_text(tb.text_frame, desc, size=Pt(14), color=LIGHT, alignment=PP_ALIGN.CENTER)
-
-    tb = add_textbox(slide, Inches(1.0), Inches(6.3), Inches(11), Inches(0.5))
-    set_text(tb.text_frame, "None of this would have been possible without each of you", size=Pt(17), color=DIM, italic=True, alignment=PP_ALIGN.CENTER)
+        add_text(batch, x + Inches(0.1), Inches(3.3), Inches(2.7), Inches(2.2), desc, size=Pt(14), color=LIGHT, alignment=PP_ALIGN.CENTER)
 
-    add_slide_number(slide, 16)
+    add_text(batch, Inches(1.0), Inches(6.3), Inches(11), Inches(0.5), "None of this would have been possible without each of you", size=Pt(17), color=DIM, italic=True, alignment=PP_ALIGN.CENTER)
 
 
-def slide_17_closing(prs):
+@register_slide
+def slide_17_closing(slide, batch):
     """Closing"""
-    slide = prs.slides.add_slide(prs.slide_layouts[6])
     set_gradient_bg(slide, TEAL, GOLD)
 
-    tb = add_textbox(slide, Inches(2.0), Inches(1.5), Inches(9.3), Inches(2.5))
-    tf = tb.text_frame
-    tf.word_wrap = True
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    add_run(p, "The best way to learn\nleadership is to ", FONT_TITLE, Pt(36), WHITE, bold=True)
-    add_run(p, "build something", FONT_TITLE, Pt(36), GOLD, bold=True)
-    add_run(p, "\nthat matters.", FONT_TITLE, Pt(36), WHITE, bold=True)
+    add_textbox(batch, Inches(2.0), Inches(1.5), Inches(9.3), Inches(2.5), [paragraph_xml([
+        run("The best way to learn\nleadership is to ", FONT_TITLE, Pt(36), WHITE, bold=True),
+        run("build something", FONT_TITLE, Pt(36), GOLD, bold=True),
+        run("\nthat matters.", FONT_TITLE, Pt(36), WHITE, bold=True),
+    ], PP_ALIGN.CENTER)])
 
-    add_accent_line(slide, Inches(5.8), Inches(4.2), Inches(1.5))
+    add_accent_line(batch, Inches(5.8), Inches(4.2), Inches(1.5))
 
-    tb = add_textbox(slide, Inches(2.0), Inches(4.6), Inches(9.3), Inches(0.5))
-    set_text(tb.text_frame, "Thank you for your time and support.", size=Pt(17), color=LIGHT, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(2.0), Inches(4.6), Inches(9.3), Inches(0.5), "Thank you for your time and support.", size=Pt(17), color=LIGHT, alignment=PP_ALIGN.CENTER)
 
-    tb = add_textbox(slide, Inches(2.0), Inches(5.3), Inches(9.3), Inches(0.4))
-    set_text(tb.text_frame, "Bingjun Li, M.S.Ed.", size=Pt(18), color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(2.0), Inches(5.3), Inches(9.3), Inches(0.4), "Bingjun Li, M.S.Ed.", size=Pt(18), color=WHITE, bold=True, alignment=PP_ALIGN.CENTER)
 
-    tb = add_textbox(slide, Inches(2.0), Inches(5.7), Inches(9.3), Inches(0.4))
-    set_text(tb.text_frame, "Graduate Assistant · SNHS · Monmouth University", size=Pt(14), color=DIM, alignment=PP_ALIGN.CENTER)
+    add_text(batch, Inches(2.0), Inches(5.7), Inches(9.3), Inches(0.4), "Graduate Assistant · SNHS · Monmouth University", size=Pt(14), color=DIM, alignment=PP_ALIGN.CENTER)
 
-    tb = add_textbox(slide, Inches(2.0), Inches(6.1), Inches(9.3), Inches(0.4))
-    set_text(tb.text_frame, "Mentored by Dr. Clifford, Acting Dean", size=Pt(14), color=DIM, alignment=PP_ALIGN.CENTER)
-
-    add_slide_number(slide, 17)
+    add_text(batch, Inches(2.0), Inches(6.1), Inches(9.3), Inches(0.4), "Mentored by Dr. Clifford, Acting Dean", size=Pt(14), color=DIM, alignment=PP_ALIGN.CENTER)
 
 
 # ─── Main ────────────────────────────────────────────────────────────────────
-def main():
+def build(numbers=None, jobs=None):
+    """Build the deck from the registry; `numbers` (1-based) selects a subset, numbered as in the full deck.
+
+    While a slide is built, the declared images of the next PREFETCH_AHEAD selected
+    slides are read on `jobs` threads.
+    """
     prs = Presentation()
     prs.slide_width = SLIDE_W
     prs.slide_height = SLIDE_H
 
-    slide_01_title(prs)
-    slide_02_hook(prs)
-    slide_03_who_am_i(prs)
-    slide_04_mission(prs)
-    slide_05_what_i_built(prs)
-    slide_06_timeline(prs)
-    slide_07_workshop1(prs)
-    slide_08_evolution(prs)
-    slide_09_workshop2(prs)
-    slide_10_feedback(prs)
-    slide_11_challenges(prs)
-    slide_12_breakthrough(prs)
-    slide_13_impact(prs)
-    slide_14_whats_next(prs)
-    slide_15_lessons(prs)
-    slide_16_thankyou(prs)
-    slide_17_closing(prs)
-
-    out_path = os.path.join(BASE, "presentation.pptx")
-    prs.save(out_path)
+    total = len(SLIDES)
+    selected = [(num, builder) for num, builder in enumerate(SLIDES, start=1) if numbers is None or num in numbers]
+    PREFETCH.start(jobs)
+    try:
+        for i, (num, builder) in enumerate(selected):
+            for _, ahead in selected[i:i + PREFETCH_AHEAD + 1]:
+                PREFETCH.prefetch(ahead.images)
+            slide = prs.slides.add_slide(prs.slide_layouts[6])  # blank
+            with ShapeBatch(slide) as batch:
+                builder(slide, batch)
+                add_slide_number(batch, num, total)
+    finally:
+        PREFETCH.close()
+
+    # Every builder uses the blank layout; don't ship the default template's other ten.
+    prune_layouts(prs)
+    IMAGES.save()
+    return prs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--slides", help='build only these slides into a preview deck, e.g. "7-10" or "1,13"')
+    parser.add_argument("-o", "--output", help="output path (default presentation.pptx, or presentation-preview.pptx with --slides)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="image prefetch threads (default 4)")
+    args = parser.parse_args(argv)
+
+    try:
+        numbers = parse_slide_spec(args.slides, len(SLIDES)) if args.slides else None
+    except ValueError as e:
+        parser.error(str(e))
+    prs = build(numbers, args.jobs)
+
+    default_name = "presentation-preview.pptx" if numbers else "presentation.pptx"
+    out_path = args.output or os.path.join(BASE, default_name)
+    save_deterministic(prs, out_path)
     print(f"✅ Saved {out_path}")
     print(f"   {len(prs.slides)} slides generated")
+    print(f"   Images: {PREFETCH.hits} prefetched ({PREFETCH.waits} waited on, {PREFETCH.wait_time * 1000:.0f} ms), "
+          f"{PREFETCH.misses} read in place, {PREFETCH.unused} unused")
+    if PREFETCH.missing:
+        print(f"⚠️  Missing images, left off their slides: {', '.join(PREFETCH.missing)}")
+    _, impact_source = read_impact()
+    print(f"   Impact numbers: {impact_source}")
 
 
 if __name__ == "__main__":
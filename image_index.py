@@ -0,0 +1,110 @@
+"""Image dimensions from file headers only, with a persisted index and fit/cover placement math."""
+
+import json
+import os
+import struct
+
+# ─── Constants ───────────────────────────────────────────────────────────────
+BASE = os.path.dirname(os.path.abspath(__file__))
+INDEX_PATH = os.path.join(BASE, ".image-index.json")
+INDEX_VERSION = 1
+
+PNG_SIG = b"\x89PNG\r\n\x1a\n"
+# JPEG start-of-frame markers carry the dimensions (C4, C8 and CC are not frames).
+JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+NATIVE_DPI = 96
+
+FIT_MODES = ("contain", "cover", "center")
+
+
+# ─── Probing ─────────────────────────────────────────────────────────────────
+def probe(path):
+    """(width, height) in pixels, reading only the header bytes of a PNG, JPEG or GIF."""
+    with open(path, "rb") as f:
+        head = f.read(26)
+        if head.startswith(PNG_SIG) and head[12:16] == b"IHDR":
+            return struct.unpack(">II", head[16:24])
+        if head[:6] in (b"GIF87a", b"GIF89a"):
+            return struct.unpack("<HH", head[6:10])
+        if head[:2] == b"\xff\xd8":
+            return _probe_jpeg(f)
+    raise ValueError(f"unsupported image format: {path}")
+
+
+def _probe_jpeg(f):
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        while byte and byte != b"\xff":
+            byte = f.read(1)
+        while byte == b"\xff":
+            byte = f.read(1)
+        if not byte:
+            break
+        marker = byte[0]
+        if marker in (0x01, 0xD8) or 0xD0 <= marker <= 0xD7:
+            continue  # standalone markers have no length
+        (length,) = struct.unpack(">H", f.read(2))
+        if marker in JPEG_SOF:
+            height, width = struct.unpack(">xHH", f.read(5))
+            return width, height
+        f.seek(length - 2, os.SEEK_CUR)
+    raise ValueError("JPEG without a start-of-frame marker")
+
+
+# ─── Index ───────────────────────────────────────────────────────────────────
+class ImageIndex:
+    """Persisted path -> dimensions map, re-probed when a file's mtime or size changes."""
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION:
+                self.entries = data["images"]
+
+    def size(self, path):
+        st = os.stat(path)
+        key = os.path.relpath(path, BASE)
+        entry = self.entries.get(key)
+        if entry is None or entry["mtime_ns"] != st.st_mtime_ns or entry["bytes"] != st.st_size:
+            w, h = probe(path)
+            entry = self.entries[key] = {"mtime_ns": st.st_mtime_ns, "bytes": st.st_size, "w": w, "h": h}
+            self.dirty = True
+        return entry["w"], entry["h"]
+
+    def save(self):
+        if not self.dirty:
+            return
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "images": self.entries}, f, indent=2, sort_keys=True)
+        self.dirty = False
+
+
+# ─── Placement ───────────────────────────────────────────────────────────────
+def fit_box(mode, box_w, box_h, img_w, img_h):
+    """Place an img_w x img_h pixel image in a box_w x box_h box.
+
+    Returns (dx, dy, width, height, crop) with offsets and sizes in the box's units
+    and crop as (left, top, right, bottom) fractions of the image:
+      contain: largest size that fits, centered
+      cover:   fills the box, overflow cropped equally from both sides
+      center:  native size at 96 DPI (box units must be EMU), shrunk to fit if larger
+    """
+    no_crop = (0.0, 0.0, 0.0, 0.0)
+    if mode == "cover":
+        scale = max(box_w / img_w, box_h / img_h)
+        excess_x = 1 - box_w / (img_w * scale)
+        excess_y = 1 - box_h / (img_h * scale)
+        return 0, 0, box_w, box_h, (excess_x / 2, excess_y / 2, excess_x / 2, excess_y / 2)
+    if mode == "contain":
+        scale = min(box_w / img_w, box_h / img_h)
+    elif mode == "center":
+        scale = min(914400 / NATIVE_DPI, box_w / img_w, box_h / img_h)
+    else:
+        raise ValueError(f"unknown fit mode {mode!r}; expected one of {FIT_MODES}")
+    w, h = round(img_w * scale), round(img_h * scale)
+    return (box_w - w) // 2, (box_h - h) // 2, w, h, no_crop
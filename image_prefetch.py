@@ -0,0 +1,85 @@
+"""Read and hash slide images on a thread pool while earlier slides are being built."""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pptx.parts.image import Image
+
+# ─── Constants ───────────────────────────────────────────────────────────────
+DEFAULT_JOBS = 4       # reads are I/O bound; a few threads are enough to stay ahead of the builder
+
+
+# ─── Loading ─────────────────────────────────────────────────────────────────
+def load(path):
+    """A python-pptx Image with its SHA-1 and format already worked out, or None if `path` is missing."""
+    try:
+        with open(path, "rb") as f:
+            blob = f.read()
+    except FileNotFoundError:
+        return None
+    image = Image.from_blob(blob, os.path.basename(path))
+    # Both are lazy; computing them here keeps hashing and header parsing off the build thread.
+    image.sha1
+    image.content_type
+    return image
+
+
+# ─── Prefetcher ──────────────────────────────────────────────────────────────
+class ImagePrefetcher:
+    """Loads declared images ahead of use on a bounded pool; get() waits only if a read is still in flight.
+
+    Without start() (or for paths never passed to prefetch()) get() loads synchronously
+    and counts a miss. Files that don't exist are listed in `missing` instead of counted.
+    """
+
+    def __init__(self):
+        self.pool = None
+        self.pending = {}
+        self.hits = self.misses = self.waits = self.unused = 0
+        self.wait_time = 0.0
+        self.missing = []
+
+    def start(self, jobs=None):
+        self.pool = ThreadPoolExecutor(max_workers=jobs or DEFAULT_JOBS, thread_name_prefix="prefetch")
+
+    def prefetch(self, paths):
+        if self.pool is None:
+            return
+        for path in paths:
+            key = os.path.abspath(path)
+            if key not in self.pending:
+                self.pending[key] = self.pool.submit(load, key)
+
+    def get(self, path):
+        future = self.pending.pop(os.path.abspath(path), None)
+        if future is None:
+            image = load(path)
+            prefetched = False
+        elif future.done():
+            image = future.result()
+            prefetched = True
+        else:
+            self.waits += 1
+            start = time.perf_counter()
+            image = future.result()
+            self.wait_time += time.perf_counter() - start
+            prefetched = True
+        if image is None:
+            self.missing.append(os.path.basename(path))
+        elif prefetched:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return image
+
+    def close(self):
+        """Stop the pool; images prefetched but never placed are counted as unused."""
+        if self.pool is None:
+            return
+        self.unused += len(self.pending)
+        for future in self.pending.values():
+            future.cancel()
+        self.pending = {}
+        self.pool.shutdown()
+        self.pool = None
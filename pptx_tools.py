@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""Maintenance commands for .pptx packages (ours or ones we receive)."""
+
+import argparse
+import io
+import os
+import posixpath
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree
+from PIL import Image
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import XmlPart
+
+# ─── Constants ───────────────────────────────────────────────────────────────
+BASE = os.path.dirname(os.path.abspath(__file__))
+IMG_DIR = os.path.join(BASE, "slide-images")
+
+EMU_PER_INCH = 914400
+DEFAULT_DPI = 150
+# Only re-encode when the image is at least this much larger than needed.
+RESIZE_SLACK = 1.1
+JPEG_QUALITY = 85
+# Longest edge for imported slide images; same cap build_site.py uses for the web deck.
+IMPORT_MAX_PX = 1600
+
+# Every zip entry gets the same timestamp so identical decks give identical bytes.
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+CONTENT_TYPES = "[Content_Types].xml"
+
+NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+NS_PKG_RELS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+# Relationships that are only alive while the part XML mentions their rId.
+# (slide -> layout, layout -> master etc. are implicit and must never be pruned.)
+EXPLICIT_RELS = {RT.IMAGE, RT.MEDIA, RT.VIDEO, RT.AUDIO, RT.HYPERLINK, RT.OLE_OBJECT}
+
+
+# ─── Slide selection ─────────────────────────────────────────────────────────
+def parse_slide_spec(spec, total):
+    """Parse a selection like "7-10" or "1,3,7-9" into sorted 1-based slide numbers."""
+    selected = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        lo, _, hi = part.partition("-")
+        lo, hi = int(lo), int(hi or lo)
+        if not 1 <= lo <= hi <= total:
+            raise ValueError(f"slide range {part!r} is outside 1-{total}")
+        selected.update(range(lo, hi + 1))
+    return sorted(selected)
+
+
+# ─── Layouts / masters ───────────────────────────────────────────────────────
+def prune_layouts(prs):
+    """Remove slide layouts no slide is based on, then masters left with no layouts.
+
+    Returns (layouts_removed, masters_removed). Parts that become unreachable are
+    dropped by python-pptx when the package is saved.
+    """
+    used = {slide.slide_layout.part for slide in prs.slides}
+    layouts_removed = masters_removed = 0
+    for master in list(prs.slide_masters):
+        for layout in list(master.slide_layouts):
+            if layout.part not in used:
+                master.slide_layouts.remove(layout)
+                layouts_removed += 1
+
+    id_lst = prs.slide_masters._sldMasterIdLst
+    for master, sld_master_id in list(zip(prs.slide_masters, id_lst.sldMasterId_lst)):
+        if len(master.slide_layouts) == 0 and len(prs.slide_masters) > 1:
+            rId = sld_master_id.rId
+            id_lst.remove(sld_master_id)
+            prs.part.drop_rel(rId)
+            masters_removed += 1
+    return layouts_removed, masters_removed
+
+
+def prune_rels(prs):
+    """Drop media/hyperlink relationships whose rId no longer appears in the part XML."""
+    dropped = 0
+    for part in list(prs.part.package.iter_parts()):
+        if not isinstance(part, XmlPart):
+            continue
+        referenced = set(part._element.xpath("//@r:*"))
+        for rId, rel in list(part.rels.items()):
+            if rel.reltype in EXPLICIT_RELS and rId not in referenced:
+                part.rels.pop(rId)
+                dropped += 1
+    return dropped
+
+
+# ─── Images ──────────────────────────────────────────────────────────────────
+def _displayed_pixels(blip, dpi):
+    """(w, h) pixels needed to show `blip` at `dpi`, or None when the size is not known."""
+    pic = next(blip.iterancestors(f"{{{NS_P}}}pic"), None)
+    if pic is None:
+        return None  # background / shape fill: stretched to an unknown box
+    ext = pic.find(f"{{{NS_P}}}spPr/{{{NS_A}}}xfrm/{{{NS_A}}}ext")
+    if ext is None:
+        return None  # placeholder picture inheriting its size from the layout
+    cx, cy = int(ext.get("cx")), int(ext.get("cy"))
+    # A group maps its children's chExt box onto its own ext, so a picture inside an
+    # enlarged group is shown larger than its own ext says; apply every enclosing group.
+    for grp in pic.iterancestors(f"{{{NS_P}}}grpSp"):
+        xfrm = grp.find(f"{{{NS_P}}}grpSpPr/{{{NS_A}}}xfrm")
+        grp_ext = xfrm.find(f"{{{NS_A}}}ext") if xfrm is not None else None
+        ch_ext = xfrm.find(f"{{{NS_A}}}chExt") if xfrm is not None else None
+        if grp_ext is None or ch_ext is None:
+            return None
+        ch_cx, ch_cy = int(ch_ext.get("cx")), int(ch_ext.get("cy"))
+        if not ch_cx or not ch_cy:
+            return None
+        cx = cx * int(grp_ext.get("cx")) / ch_cx
+        cy = cy * int(grp_ext.get("cy")) / ch_cy
+    src = blip.getparent().find(f"{{{NS_A}}}srcRect")
+    crop_x = crop_y = 0.0
+    if src is not None:
+        crop_x = (int(src.get("l", 0)) + int(src.get("r", 0))) / 100000
+        crop_y = (int(src.get("t", 0)) + int(src.get("b", 0))) / 100000
+    w = cx / EMU_PER_INCH * dpi / max(1 - crop_x, 0.01)
+    h = cy / EMU_PER_INCH * dpi / max(1 - crop_y, 0.01)
+    return w, h
+
+
+def image_targets(prs, dpi):
+    """Map each image part to the largest pixel size it is displayed at (None: keep as is)."""
+    targets = {}
+    for part in prs.part.package.iter_parts():
+        if not isinstance(part, XmlPart):
+            continue
+        for blip in part._element.iter(f"{{{NS_A}}}blip"):
+            rId = blip.get(f"{{{NS_R}}}embed")
+            if not rId or rId not in part.rels:
+                continue
+            image_part = part.related_part(rId)
+            need = _displayed_pixels(blip, dpi)
+            if image_part in targets and (targets[image_part] is None or need is None):
+                targets[image_part] = None
+            elif image_part in targets:
+                old = targets[image_part]
+                targets[image_part] = (max(old[0], need[0]), max(old[1], need[1]))
+            else:
+                targets[image_part] = need
+    return targets
+
+
+def recompress(blob, max_w, max_h):
+    """Downscale `blob` to fit (max_w, max_h) px and re-encode in its own format.
+
+    Returns the new bytes, or None when the result would not be smaller.
+    """
+    try:
+        img = Image.open(io.BytesIO(blob))
+    except OSError:
+        return None  # EMF/WMF/SVG and other formats Pillow can't decode
+    fmt = img.format
+    if fmt not in ("PNG", "JPEG"):
+        return None
+    scale = min(max_w / img.width, max_h / img.height, 1.0)
+    if scale * RESIZE_SLACK > 1.0 and fmt == "JPEG":
+        return None
+    if scale * RESIZE_SLACK < 1.0:
+        img = img.resize((max(1, round(img.width * scale)), max(1, round(img.height * scale))),
+                         Image.LANCZOS)
+    out = io.BytesIO()
+    if fmt == "PNG":
+        img.save(out, "PNG", optimize=True)
+    else:
+        img.convert("RGB").save(out, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    data = out.getvalue()
+    return data if len(data) < len(blob) else None
+
+
+def downscale_images(prs, dpi=DEFAULT_DPI):
+    """Recompress every picture to `dpi` at its largest displayed size; returns bytes saved."""
+    saved = 0
+    for image_part, need in image_targets(prs, dpi).items():
+        if need is None:
+            continue
+        data = recompress(image_part.blob, *need)
+        if data is not None:
+            saved += len(image_part.blob) - len(data)
+            image_part._blob = data  # ImagePart has no public setter
+    return saved
+
+
+# ─── Streaming reads ─────────────────────────────────────────────────────────
+def _rels(zf, partname):
+    """{rId: (reltype, target partname)} for a part, read straight from the zip."""
+    folder, name = posixpath.split(partname)
+    rels_name = posixpath.join(folder, "_rels", name + ".rels")
+    if rels_name not in zf.NameToInfo:
+        return {}
+    rels = {}
+    for rel in etree.parse(zf.open(rels_name)).getroot().iter(f"{{{NS_PKG_RELS}}}Relationship"):
+        if rel.get("TargetMode") == "External":
+            continue
+        target = posixpath.normpath(posixpath.join(folder, rel.get("Target")))
+        rels[rel.get("Id")] = (rel.get("Type"), target.lstrip("/"))
+    return rels
+
+
+def slide_partnames(zf):
+    """Slide part names in presentation order, without loading the package."""
+    rels = _rels(zf, "ppt/presentation.xml")
+    root = etree.parse(zf.open("ppt/presentation.xml")).getroot()
+    return [rels[sld.get(f"{{{NS_R}}}id")][1] for sld in root.iter(f"{{{NS_P}}}sldId")]
+
+
+def slide_media(zf, partname):
+    """Image part names used by a slide, in z-order, each listed once."""
+    rels = _rels(zf, partname)
+    root = etree.parse(zf.open(partname)).getroot()
+    media = []
+    for blip in root.iter(f"{{{NS_A}}}blip"):
+        rel = rels.get(blip.get(f"{{{NS_R}}}embed"))
+        if rel and rel[0] == RT.IMAGE and rel[1] not in media:
+            media.append(rel[1])
+    return media
+
+
+def slide_subset(zf, keep):
+    """Bytes of a package holding only the slides in `keep` (part names) and the parts they reach.
+
+    presentation.xml and its rels drop the other slides; parts only those slides used
+    (their media, notes, ...) are never read, so python-pptx parses just the selection
+    plus the layouts, masters and theme it depends on.
+    """
+    keep = set(keep)
+    slides = set(slide_partnames(zf))
+    pres_rels = "ppt/_rels/presentation.xml.rels"
+    reached, todo = set(), [""]
+    while todo:
+        partname = todo.pop()
+        for _, target in _rels(zf, partname).values():
+            if target in reached or partname == "ppt/presentation.xml" and target in slides and target not in keep:
+                continue
+            reached.add(target)
+            todo.append(target)
+
+    pres = etree.parse(zf.open("ppt/presentation.xml")).getroot()
+    rels = etree.parse(zf.open(pres_rels)).getroot()
+    dropped = set()
+    for rel in list(rels):
+        target = posixpath.normpath(posixpath.join("ppt", rel.get("Target"))).lstrip("/")
+        if target in slides and target not in keep:
+            dropped.add(rel.get("Id"))
+            rels.remove(rel)
+    for sld in list(pres.iter(f"{{{NS_P}}}sldId")):
+        if sld.get(f"{{{NS_R}}}id") in dropped:
+            sld.getparent().remove(sld)
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as out:
+        for name in zf.namelist():
+            if name == "ppt/presentation.xml":
+                out.writestr(name, etree.tostring(pres, xml_declaration=True, encoding="UTF-8", standalone=True))
+            elif name == pres_rels:
+                out.writestr(name, etree.tostring(rels, xml_declaration=True, encoding="UTF-8", standalone=True))
+            elif name == CONTENT_TYPES or name == "_rels/.rels":
+                out.writestr(name, zf.read(name))
+            else:
+                folder, base = posixpath.split(name)
+                part = posixpath.join(posixpath.dirname(folder), base[:-5]) if folder.endswith("_rels") else name
+                if part in reached:
+                    out.writestr(name, zf.read(name))
+    return buf.getvalue()
+
+
+# ─── Saving ──────────────────────────────────────────────────────────────────
+def write_canonical_zip(src, dst):
+    """Rewrite zip `src` to `dst` with sorted entries, a fixed timestamp and fixed attributes."""
+    with zipfile.ZipFile(src) as zin:
+        names = sorted(zin.namelist(), key=lambda n: (n != CONTENT_TYPES, n))
+        entries = [(name, zin.read(name)) for name in names]
+    with zipfile.ZipFile(dst, "w") as zout:
+        for name, data in entries:
+            info = zipfile.ZipInfo(name, date_time=ZIP_EPOCH)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 3
+            info.external_attr = 0o644 << 16
+            zout.writestr(info, data)
+
+
+def save_deterministic(prs, path):
+    """Save `prs` so that two builds of the same deck are byte-for-byte identical.
+
+    python-pptx already assigns rIds, shape ids and part names in build order;
+    only the zip timestamps vary, so the package is rewritten canonically.
+    """
+    buf = io.BytesIO()
+    prs.save(buf)
+    buf.seek(0)
+    write_canonical_zip(buf, path)
+
+
+# ─── Commands ────────────────────────────────────────────────────────────────
+def optimize(src, dst=None, dpi=DEFAULT_DPI):
+    """Prune unused layouts/masters/media and recompress images; returns (before, after) bytes."""
+    dst = dst or src
+    before = os.path.getsize(src)
+    prs = Presentation(src)
+    layouts, masters = prune_layouts(prs)
+    rels = prune_rels(prs)
+    downscale_images(prs, dpi)
+    save_deterministic(prs, dst)
+    after = os.path.getsize(dst)
+    print(f"   {layouts} layouts, {masters} masters, {rels} dangling media links removed")
+    return before, after
+
+
+def cmd_optimize(args):
+    for src in args.files:
+        dst = args.output
+        before, after = optimize(src, dst, args.dpi)
+        pct = (1 - after / before) * 100 if before else 0
+        print(f"✅ {dst or src}: {before / 1e6:.1f} MB → {after / 1e6:.1f} MB ({pct:.0f}% smaller)")
+    return 0
+
+
+def write_if_changed(path, data):
+    """Write `data` unless the file already holds exactly these bytes; returns True if written."""
+    if os.path.exists(path) and os.path.getsize(path) == len(data):
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+def render_thumbnails(src, numbers, max_px=IMPORT_MAX_PX):
+    """{slide number: PNG bytes} rendered with preview_pptx at max_px wide.
+
+    Only the selected slides are loaded, from a slide_subset() of the package; picture
+    bytes are still read from `src` itself, which keeps the same part names.
+    """
+    # Imported here: the renderer needs numpy, which the Pages build doesn't install.
+    from preview_pptx import extract, render_slide
+    numbers = sorted(numbers)
+    with zipfile.ZipFile(src) as zf:
+        slides = slide_partnames(zf)
+        subset = slide_subset(zf, [slides[n - 1] for n in numbers])
+    thumbs = {}
+    for n, spec in zip(numbers, extract(io.BytesIO(subset))):
+        buf = io.BytesIO()
+        render_slide((spec, src, buf, max_px * EMU_PER_INCH / spec["size"][0]))
+        thumbs[n] = buf.getvalue()
+    return thumbs
+
+
+def _import_one(job):
+    name, data, out_dir, max_px = job
+    small = recompress(data, max_px, max_px) or data
+    changed = write_if_changed(os.path.join(out_dir, name), small)
+    return name, len(data), len(small) if changed else None
+
+
+def import_deck(src, prefix, numbers=None, out_dir=IMG_DIR, max_px=IMPORT_MAX_PX, thumbnails=False, jobs=None):
+    """Copy the media of selected slides of `src` into `out_dir` as <prefix>-NN-K.<ext>.
+
+    Only the zip entries those slides need are read. With `thumbnails`, each slide is
+    also rendered to <prefix>-NN.png. Everything goes through recompress(), in parallel.
+    Returns a list of (name, source bytes, written bytes or None when unchanged).
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    files = []
+    with zipfile.ZipFile(src) as zf:
+        slides = slide_partnames(zf)
+        numbers = numbers or range(1, len(slides) + 1)
+        for n in numbers:
+            for k, media in enumerate(slide_media(zf, slides[n - 1]), 1):
+                ext = posixpath.splitext(media)[1].lower().replace(".jpeg", ".jpg")
+                files.append((f"{prefix}-{n:02d}-{k}{ext}", zf.read(media)))
+    if thumbnails:
+        files += [(f"{prefix}-{n:02d}.png", png) for n, png in render_thumbnails(src, numbers, max_px).items()]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(_import_one, [(name, data, out_dir, max_px) for name, data in files]))
+
+
+def cmd_import_deck(args):
+    with zipfile.ZipFile(args.deck) as zf:
+        total = len(slide_partnames(zf))
+    try:
+        numbers = parse_slide_spec(args.slides, total) if args.slides else None
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+    prefix = args.prefix or os.path.splitext(os.path.basename(args.deck))[0]
+    results = import_deck(args.deck, prefix, numbers, args.output, args.max_px, args.thumbnails, args.jobs)
+    for name, before, after in results:
+        if after is None:
+            print(f"   {name}: unchanged")
+        else:
+            print(f"   {name}: {before / 1e3:.0f} KB → {after / 1e3:.0f} KB")
+    written = sum(1 for r in results if r[2] is not None)
+    print(f"✅ {args.deck}: {len(results)} images, {written} written to {args.output}")
+    return 0
+
+
+# ─── Main ────────────────────────────────────────────────────────────────────
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    optimize_parser = p = sub.add_parser("optimize", help="remove unused layouts/masters/media and recompress images")
+    p.add_argument("files", nargs="+", help=".pptx files to optimize (rewritten in place)")
+    p.add_argument("-o", "--output", help="write here instead (single input only)")
+    p.add_argument("--dpi", type=int, default=DEFAULT_DPI, help=f"target image DPI (default {DEFAULT_DPI})")
+    p.set_defaults(func=cmd_optimize)
+
+    p = sub.add_parser("import-deck", help="copy slide media (and rendered thumbnails) from a deck into slide-images/")
+    p.add_argument("deck", help="source .pptx")
+    p.add_argument("--slides", help='slide numbers to import, e.g. "3,5,9" or "1-4" (default: all)')
+    p.add_argument("--prefix", help="file name prefix, e.g. ws1 (default: the deck's file name)")
+    p.add_argument("--thumbnails", action="store_true",
+                   help="also render each slide to <prefix>-NN.png (python-pptx parses the selected slides and "
+                        "the layouts, masters and theme they use, not the rest of the deck)")
+    p.add_argument("-o", "--output", default=IMG_DIR, help="output directory (default slide-images/)")
+    p.add_argument("--max-px", type=int, default=IMPORT_MAX_PX, help=f"longest image edge (default {IMPORT_MAX_PX})")
+    p.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    p.set_defaults(func=cmd_import_deck)
+
+    args = parser.parse_args(argv)
+    if args.command == "optimize" and args.output and len(args.files) > 1:
+        optimize_parser.error("-o/--output takes a single input file; without it each file is rewritten in place")
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,502 @@
+#!/usr/bin/env python3
+"""Render approximate PNG previews of a generated deck, a contact sheet and a diff against the last run."""
+
+import argparse
+import io
+import math
+import os
+import re
+import shutil
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+from pptx import Presentation
+from pptx.enum.dml import MSO_FILL
+from pptx.enum.shapes import MSO_SHAPE, MSO_SHAPE_TYPE
+from pptx.enum.text import PP_ALIGN
+from pptx.text.text import _Run
+
+# ─── Constants ───────────────────────────────────────────────────────────────
+BASE = os.path.dirname(os.path.abspath(__file__))
+DECK = os.path.join(BASE, "presentation.pptx")
+OUT_DIR = os.path.join(BASE, "preview")
+
+EMU_PER_INCH = 914400
+DEFAULT_DPI = 96                      # 13.333 x 7.5 in -> 1280 x 720
+TEXT_INSET_X = 0.1 * EMU_PER_INCH     # python-pptx default body insets
+TEXT_INSET_Y = 0.05 * EMU_PER_INCH
+LINE_SPACING = 1.2
+MIN_SHRINK = 0.6                      # smallest scale for text that overflows its box
+
+THUMB_W = 320
+SHEET_COLS = 4
+DIFF_LEVEL = 24                       # per-pixel grey-level change that counts (and is marked in diff-NN.png)
+DIFF_MIN_PIXELS = 4                   # changed pixels that flag a slide; renders are deterministic
+
+# Overview sprite for the HTML deck: one JPEG, thumbnails packed row by row with no gaps.
+# The column count is read from data-cols on #overview in presentation.html.
+SPRITE_PATH = os.path.join(BASE, "slide-images", "overview-sprite.jpg")
+HTML_DECK = os.path.join(BASE, "presentation.html")
+SPRITE_COLS_RE = re.compile(r'id="overview"[^>]*\bdata-cols="(\d+)"')
+SPRITE_THUMB = (320, 180)             # 5 columns x 320 = 1600 px, which build_site.py leaves as is
+SPRITE_QUALITY = 80
+
+# Font files tried in order for (serif, bold); the first that loads wins. The deck's own
+# fonts come first, then metric-compatible stand-ins (Carlito for Calibri, Gelasio for
+# Georgia) so lines break where PowerPoint breaks them, then whatever is usually installed.
+FONT_FILES = {
+    "sans": ["calibri.ttf", "Calibri.ttf", "Carlito-Regular.ttf", "DejaVuSans.ttf", "LiberationSans-Regular.ttf",
+             "Arial.ttf"],
+    "sans-bold": ["calibrib.ttf", "Calibri Bold.ttf", "Carlito-Bold.ttf", "DejaVuSans-Bold.ttf",
+                  "LiberationSans-Bold.ttf", "Arial Bold.ttf"],
+    "serif": ["georgia.ttf", "Georgia.ttf", "Gelasio-Regular.ttf", "DejaVuSerif.ttf", "LiberationSerif-Regular.ttf"],
+    "serif-bold": ["georgiab.ttf", "Georgia Bold.ttf", "Gelasio-Bold.ttf", "DejaVuSerif-Bold.ttf",
+                   "LiberationSerif-Bold.ttf"],
+}
+# Tried in order for characters the text font lacks (emoji, symbols). Bitmap-only emoji
+# fonts that can't be scaled fail to load and are skipped; characters no font has are dropped.
+FALLBACK_FONTS = ["seguiemj.ttf", "Segoe UI Emoji.ttf", "NotoColorEmoji.ttf", "Symbola.ttf", "seguisym.ttf",
+                  "NotoSansSymbols2-Regular.ttf", "DejaVuSans.ttf"]
+NOTDEF_PROBE = "\uffff"               # a noncharacter: every font draws it as its missing-glyph box
+ZERO_WIDTH = {"\ufe0e", "\ufe0f", "\u200d"}
+SERIF_FONTS = {"Georgia", "Playfair Display", "Times New Roman", "Cambria"}
+
+ALIGN = {PP_ALIGN.CENTER: "center", PP_ALIGN.RIGHT: "right"}
+SHAPES = {MSO_SHAPE.RECTANGLE: "rect", MSO_SHAPE.ROUNDED_RECTANGLE: "round", MSO_SHAPE.OVAL: "oval"}
+
+
+# ─── Extraction ──────────────────────────────────────────────────────────────
+# Slides are flattened to plain dicts in the parent process so workers only
+# need the zip (for picture bytes), not a second parsed copy of the package.
+def _rgb(color_format):
+    try:
+        return "#" + str(color_format.rgb)
+    except (AttributeError, TypeError):
+        return None
+
+
+def _fill(fill):
+    try:
+        return _rgb(fill.fore_color) if fill.type == MSO_FILL.SOLID else None
+    except TypeError:
+        return None
+
+
+def _line(shape):
+    try:
+        line = shape.line
+        if line.fill.type != MSO_FILL.SOLID:
+            return None, 0
+        return _rgb(line.color), line.width or 12700
+    except (AttributeError, TypeError):
+        return None, 0
+
+
+def _background(slide):
+    bg = slide.element.find(".//{*}bg/{*}bgPr")
+    if bg is None:
+        return {"type": "solid", "color": "#FFFFFF"}
+    grad = bg.find("{*}gradFill")
+    if grad is not None:
+        stops = [(int(gs.get("pos")) / 100000, "#" + gs.find("{*}srgbClr").get("val"))
+                 for gs in grad.iter("{*}gs") if gs.find("{*}srgbClr") is not None]
+        lin = grad.find("{*}lin")
+        angle = int(lin.get("ang", 0)) / 60000 if lin is not None else 0
+        return {"type": "gradient", "stops": stops, "angle": angle}
+    solid = bg.find("{*}solidFill/{*}srgbClr")
+    return {"type": "solid", "color": "#" + solid.get("val") if solid is not None else "#FFFFFF"}
+
+
+def _paragraphs(text_frame):
+    paragraphs = []
+    for p in text_frame.paragraphs:
+        runs = []
+        for child in p._p:
+            tag = child.tag.rsplit("}", 1)[-1]
+            if tag == "br":
+                runs.append({"text": "\n"})
+            elif tag == "r":
+                font = _Run(child, p).font
+                runs.append({
+                    "text": child.findtext("{*}t") or "",
+                    "size": font.size.pt if font.size else 18,
+                    "bold": bool(font.bold),
+                    "italic": bool(font.italic),
+                    "serif": (font.name or "") in SERIF_FONTS,
+                    "color": _rgb(font.color) or "#000000",
+                })
+        paragraphs.append({"align": ALIGN.get(p.alignment, "left"), "runs": runs})
+    return paragraphs
+
+
+def _shape(shape, image_names):
+    box = [shape.left or 0, shape.top or 0, shape.width or 0, shape.height or 0]
+    if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
+        rId = shape._element.blip_rId
+        return {"kind": "picture", "box": box, "image": image_names[rId],
+                "crop": [shape.crop_left, shape.crop_top, shape.crop_right, shape.crop_bottom]}
+    item = {"kind": "text", "box": box, "fill": None, "line": None, "line_w": 0, "anchor": "t"}
+    if shape.shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE:
+        item["kind"] = SHAPES.get(shape.auto_shape_type, "rect")
+        item["fill"] = _fill(shape.fill)
+        item["line"], item["line_w"] = _line(shape)
+    if shape.has_text_frame:
+        body_pr = shape.text_frame._txBody.bodyPr
+        item["anchor"] = body_pr.get("anchor", "ctr" if item["kind"] != "text" else "t")
+        item["paragraphs"] = _paragraphs(shape.text_frame)
+    return item
+
+
+def extract(path):
+    """Flatten every slide of `path` into a JSON-like list of drawing primitives."""
+    prs = Presentation(path)
+    slides = []
+    for slide in prs.slides:
+        image_names = {rId: rel.target_part.partname.lstrip("/")
+                       for rId, rel in slide.part.rels.items() if "image" in rel.reltype}
+        slides.append({
+            "size": (prs.slide_width, prs.slide_height),
+            "background": _background(slide),
+            "shapes": [_shape(sh, image_names) for sh in slide.shapes],
+        })
+    return slides
+
+
+# ─── Drawing ─────────────────────────────────────────────────────────────────
+_font_cache = {}
+_fallback_cache = {}
+_glyph_cache = {}
+
+
+def get_font(serif, bold, size_px):
+    key = (serif, bold, size_px)
+    if key not in _font_cache:
+        family = ("serif" if serif else "sans") + ("-bold" if bold else "")
+        font = None
+        for name in FONT_FILES[family]:
+            try:
+                font = ImageFont.truetype(name, size_px)
+                break
+            except OSError:
+                continue
+        _font_cache[key] = font or ImageFont.load_default(size_px)
+    return _font_cache[key]
+
+
+def fallback_fonts(size_px):
+    if size_px not in _fallback_cache:
+        fonts = []
+        for name in FALLBACK_FONTS:
+            try:
+                fonts.append(ImageFont.truetype(name, size_px))
+            except OSError:
+                continue
+        _fallback_cache[size_px] = fonts
+    return _fallback_cache[size_px]
+
+
+def _mask(font, ch):
+    key = (id(font), ch)
+    if key not in _glyph_cache:
+        try:
+            left, top, right, bottom = font.getbbox(ch)
+            img = Image.new("L", (max(1, right - left), max(1, bottom - top)))
+            ImageDraw.Draw(img).text((-left, -top), ch, font=font, fill=255)
+            _glyph_cache[key] = (img.size, img.tobytes())
+        except OSError:
+            _glyph_cache[key] = None
+    return _glyph_cache[key]
+
+
+def has_glyph(font, ch):
+    """True unless `font` would draw `ch` as its missing-glyph box."""
+    if ch.isspace():
+        return True
+    mask = _mask(font, ch)
+    return mask is not None and mask != _mask(font, NOTDEF_PROBE)
+
+
+def glyph_runs(text, font):
+    """Split `text` into [(substring, font)], using FALLBACK_FONTS for characters `font` lacks.
+
+    Characters no font can draw are dropped rather than shown as missing-glyph boxes.
+    """
+    runs = []
+    for ch in text:
+        if ch in ZERO_WIDTH:
+            continue
+        use = font if has_glyph(font, ch) else next(
+            (f for f in fallback_fonts(font.size) if has_glyph(f, ch)), None)
+        if use is None:
+            continue
+        if runs and runs[-1][1] is use:
+            runs[-1] = (runs[-1][0] + ch, use)
+        else:
+            runs.append((ch, use))
+    return runs
+
+
+def runs_width(runs):
+    return sum(font.getlength(text) for text, font in runs)
+
+
+def draw_background(img, bg):
+    if bg["type"] == "solid":
+        img.paste(bg["color"], (0, 0, *img.size))
+        return
+    w, h = img.size
+    rad = math.radians(bg["angle"])
+    dx, dy = math.cos(rad), math.sin(rad)
+    ys, xs = np.mgrid[0:h, 0:w]
+    t = xs * dx + ys * dy
+    t = (t - t.min()) / max(t.max() - t.min(), 1)
+    positions = [pos for pos, _ in bg["stops"]]
+    colors = np.array([Image.new("RGB", (1, 1), c).getpixel((0, 0)) for _, c in bg["stops"]], dtype=float)
+    rgb = np.stack([np.interp(t, positions, colors[:, i]) for i in range(3)], axis=-1)
+    img.paste(Image.fromarray(rgb.astype(np.uint8), "RGB"))
+
+
+def layout_lines(paragraphs, width, px_per_pt):
+    """Greedy word wrap; returns ([(align, [(glyph runs, color)], line_height)], wrapped)."""
+    lines = []
+    wrapped = False
+    for para in paragraphs:
+        line, line_w, line_h = [], 0, 0
+
+        def flush():
+            nonlocal line, line_w, line_h
+            lines.append((para["align"], line, line_h or 18 * px_per_pt * LINE_SPACING))
+            line, line_w, line_h = [], 0, 0
+
+        for run in para["runs"]:
+            if run["text"] == "\n" and "size" not in run:
+                flush()
+                continue
+            font = get_font(run["serif"], run["bold"], max(1, round(run["size"] * px_per_pt)))
+            line_h = max(line_h, run["size"] * px_per_pt * LINE_SPACING)
+            for i, segment in enumerate(run["text"].split("\n")):
+                if i:
+                    flush()
+                    line_h = run["size"] * px_per_pt * LINE_SPACING
+                for j, word in enumerate(segment.split(" ")):
+                    glyphs = glyph_runs((" " if j and line else "") + word, font)
+                    if not glyphs:
+                        continue
+                    piece_w = runs_width(glyphs)
+                    if line and line_w + piece_w > width:
+                        flush()
+                        wrapped = True
+                        line_h = run["size"] * px_per_pt * LINE_SPACING
+                        glyphs = glyph_runs(word, font)
+                        piece_w = runs_width(glyphs)
+                    line.append((glyphs, run["color"]))
+                    line_w += piece_w
+        flush()
+    return lines, wrapped
+
+
+def draw_text(draw, item, scale, px_per_pt):
+    x, y, w, h = (v * scale for v in item["box"])
+    inset_x, inset_y = TEXT_INSET_X * scale, TEXT_INSET_Y * scale
+    # Fallback fonts are wider than Calibri/Georgia: text that only overflows its box because
+    # it wrapped onto extra lines is shrunk, so it doesn't run into the shapes underneath.
+    shrink = 1.0
+    while True:
+        lines, wrapped = layout_lines(item["paragraphs"], w - 2 * inset_x, px_per_pt * shrink)
+        total_h = sum(lh for _, _, lh in lines)
+        if not wrapped or total_h + 2 * inset_y <= h or shrink <= MIN_SHRINK:
+            break
+        shrink -= 0.05
+    if item["anchor"] == "ctr":
+        cy = y + (h - total_h) / 2
+    elif item["anchor"] == "b":
+        cy = y + h - inset_y - total_h
+    else:
+        cy = y + inset_y
+    for align, pieces, line_h in lines:
+        line_w = sum(runs_width(glyphs) for glyphs, _ in pieces)
+        cx = {"center": x + (w - line_w) / 2, "right": x + w - inset_x - line_w}.get(align, x + inset_x)
+        for glyphs, color in pieces:
+            for text, font in glyphs:
+                draw.text((cx, cy), text, font=font, fill=color, embedded_color=True)
+                cx += font.getlength(text)
+        cy += line_h
+
+
+def draw_picture(img, item, scale, zf):
+    x, y, w, h = (round(v * scale) for v in item["box"])
+    if w <= 0 or h <= 0:
+        return
+    with zf.open(item["image"]) as f:
+        pic = Image.open(io.BytesIO(f.read()))
+        pic.draft("RGB", (w * 2, h * 2))  # JPEG: decode at reduced scale
+        pic = pic.convert("RGBA")
+    left, top, right, bottom = item["crop"]
+    pw, ph = pic.size
+    pic = pic.crop((round(left * pw), round(top * ph), round(pw * (1 - right)), round(ph * (1 - bottom))))
+    pic = pic.resize((w, h), Image.BILINEAR)
+    img.paste(pic, (x, y), pic)
+
+
+def render_slide(args):
+    """Render one flattened slide to `out_path`; runs in a worker process."""
+    spec, deck_path, out_path, dpi = args
+    scale = dpi / EMU_PER_INCH
+    px_per_pt = dpi / 72
+    size = (round(spec["size"][0] * scale), round(spec["size"][1] * scale))
+    img = Image.new("RGB", size)
+    draw_background(img, spec["background"])
+    draw = ImageDraw.Draw(img)
+    with zipfile.ZipFile(deck_path) as zf:
+        for item in spec["shapes"]:
+            if item["kind"] == "picture":
+                draw_picture(img, item, scale, zf)
+                continue
+            x, y, w, h = (v * scale for v in item["box"])
+            rect = (x, y, x + max(w, 1), y + max(h, 1))
+            outline = item["line"]
+            width = max(1, round(item["line_w"] * scale)) if outline else 0
+            if item["kind"] == "rect" and (item["fill"] or outline):
+                draw.rectangle(rect, fill=item["fill"], outline=outline, width=width)
+            elif item["kind"] == "round":
+                draw.rounded_rectangle(rect, radius=min(w, h) * 0.1667, fill=item["fill"], outline=outline, width=width)
+            elif item["kind"] == "oval":
+                draw.ellipse(rect, fill=item["fill"], outline=outline, width=width)
+            if item.get("paragraphs"):
+                draw_text(draw, item, scale, px_per_pt)
+    img.save(out_path, "PNG")
+    return out_path
+
+
+# ─── Contact sheet / diff ────────────────────────────────────────────────────
+def contact_sheet(paths, out_path):
+    thumbs = []
+    for path in paths:
+        with Image.open(path) as im:
+            thumbs.append(im.resize((THUMB_W, round(THUMB_W * im.height / im.width)), Image.BILINEAR))
+    th = thumbs[0].height
+    gap = 8
+    rows = math.ceil(len(thumbs) / SHEET_COLS)
+    sheet = Image.new("RGB", (SHEET_COLS * (THUMB_W + gap) + gap, rows * (th + gap + 16) + gap), "#0A1628")
+    draw = ImageDraw.Draw(sheet)
+    for i, thumb in enumerate(thumbs):
+        x = gap + (i % SHEET_COLS) * (THUMB_W + gap)
+        y = gap + (i // SHEET_COLS) * (th + gap + 16)
+        sheet.paste(thumb, (x, y + 16))
+        draw.text((x, y), f"{i + 1}", fill="#E9C46A", font=get_font(False, True, 12))
+    sheet.save(out_path, "PNG")
+
+
+def sprite_cols(html_path=HTML_DECK):
+    """The overview grid's column count, from data-cols on #overview."""
+    with open(html_path, encoding="utf-8") as f:
+        m = SPRITE_COLS_RE.search(f.read())
+    if m is None:
+        raise ValueError(f"{html_path}: no data-cols on #overview")
+    return int(m.group(1))
+
+
+def sprite_sheet(paths, out_path=SPRITE_PATH, cols=None, thumb=SPRITE_THUMB):
+    """Pack slide renders into the overview sprite; returns its size in bytes."""
+    cols = cols or sprite_cols()
+    rows = math.ceil(len(paths) / cols)
+    sheet = Image.new("RGB", (cols * thumb[0], rows * thumb[1]), "#0A1628")
+    for i, path in enumerate(paths):
+        with Image.open(path) as im:
+            sheet.paste(im.convert("RGB").resize(thumb, Image.LANCZOS), ((i % cols) * thumb[0], (i // cols) * thumb[1]))
+    sheet.save(out_path, "JPEG", quality=SPRITE_QUALITY, optimize=True, progressive=True)
+    return os.path.getsize(out_path)
+
+
+def visual_diff(old_path, new_path):
+    """(changed pixels, mean grey-level difference) between two renders at full resolution.
+
+    The pixel count decides whether a slide changed, so a two-digit edit counts as much
+    as a moved image; the mean only ranks changed slides by how much changed.
+    """
+    with Image.open(old_path) as a, Image.open(new_path) as b:
+        if a.size != b.size:
+            return a.width * a.height, 255.0
+        diff = np.asarray(ImageChops.difference(a.convert("L"), b.convert("L")))
+    return int((diff > DIFF_LEVEL).sum()), float(diff.mean())
+
+
+def write_diff_image(old_path, new_path, out_path):
+    with Image.open(old_path) as a, Image.open(new_path) as b:
+        diff = ImageChops.difference(a.convert("RGB"), b.convert("RGB")).convert("L")
+        mask = diff.point(lambda v: 255 if v > DIFF_LEVEL else 0)
+        marked = b.convert("RGB")
+        marked.paste("#E76F51", mask=mask)
+        Image.blend(b.convert("RGB"), marked, 0.6).save(out_path, "PNG")
+
+
+# ─── Main ────────────────────────────────────────────────────────────────────
+def render(deck_path=DECK, out_dir=OUT_DIR, dpi=DEFAULT_DPI, jobs=None):
+    """Render all slides, compare with the previous run and return (paths, changed, added, removed).
+
+    `changed` holds (slide number, changed pixels), largest mean difference first.
+    """
+    prev_dir = os.path.join(out_dir, "previous")
+    shutil.rmtree(prev_dir, ignore_errors=True)
+    os.makedirs(prev_dir)
+    for name in os.listdir(out_dir):
+        if name.startswith(("slide-", "diff-")):
+            if name.startswith("slide-"):
+                shutil.move(os.path.join(out_dir, name), os.path.join(prev_dir, name))
+            else:
+                os.remove(os.path.join(out_dir, name))
+
+    slides = extract(deck_path)
+    tasks = [(spec, deck_path, os.path.join(out_dir, f"slide-{i:02d}.png"), dpi)
+             for i, spec in enumerate(slides, start=1)]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        paths = list(pool.map(render_slide, tasks))
+    contact_sheet(paths, os.path.join(out_dir, "contact-sheet.png"))
+
+    changed, added = [], []
+    for i, path in enumerate(paths, start=1):
+        old = os.path.join(prev_dir, os.path.basename(path))
+        if not os.path.exists(old):
+            added.append(i)
+            continue
+        pixels, score = visual_diff(old, path)
+        if pixels >= DIFF_MIN_PIXELS:
+            changed.append((score, i, pixels))
+            write_diff_image(old, path, os.path.join(out_dir, f"diff-{i:02d}.png"))
+    changed = [(i, pixels) for _, i, pixels in sorted(changed, key=lambda c: (-c[0], c[1]))]
+    removed = [int(n[6:8]) for n in sorted(os.listdir(prev_dir)) if int(n[6:8]) > len(paths)]
+    return paths, changed, added, removed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("deck", nargs="?", default=DECK, help="deck to render (default presentation.pptx)")
+    parser.add_argument("-o", "--output", default=OUT_DIR, help="output directory (default preview/)")
+    parser.add_argument("--dpi", type=int, default=DEFAULT_DPI, help=f"render resolution (default {DEFAULT_DPI})")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--sprite", action="store_true",
+                        help="also write the HTML deck's overview sprite (slide-images/overview-sprite.jpg)")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.output, exist_ok=True)
+    paths, changed, added, removed = render(args.deck, args.output, args.dpi, args.jobs)
+    print(f"✅ Rendered {len(paths)} slides to {args.output}")
+    if not (changed or added or removed):
+        print("   No visual changes since the previous render")
+    if changed:
+        print(f"   Changed: {', '.join(f'{i} ({pixels} px)' for i, pixels in changed)} (see diff-NN.png)")
+    if added:
+        print(f"   New: {', '.join(map(str, added))}")
+    if removed:
+        print(f"   Removed: {', '.join(map(str, removed))}")
+    if args.sprite:
+        size = sprite_sheet(paths)
+        print(f"   Overview sprite: {os.path.relpath(SPRITE_PATH, BASE)} ({size / 1e3:.0f} KB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Render the companion Markdown documents to deck-themed HTML in docs/."""
+
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import markdown
+
+# ─── Constants ───────────────────────────────────────────────────────────────
+BASE = os.path.dirname(os.path.abspath(__file__))
+OUT_DIR = os.path.join(BASE, "docs")
+CACHE_PATH = os.path.join(BASE, ".render-cache.json")
+
+EXTENSIONS = ["toc", "tables", "sane_lists"]
+EXTENSION_CONFIGS = {"toc": {"permalink": "#", "toc_depth": "2-3"}}
+SKIP_DIRS = {".git", "docs", "node_modules", "slide-images", "survey-data"}
+
+PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>{title}</title>
+<style>
+  @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=Playfair+Display:wght@700;800&display=swap');
+
+  * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+
+  :root {{
+    --navy: #0a1628;
+    --blue: #1e3a5f;
+    --teal: #2a9d8f;
+    --gold: #e9c46a;
+    --coral: #e76f51;
+    --white: #f8f9fa;
+    --light: #e8ecf1;
+    --dim: #8899aa;
+    --card: rgba(255,255,255,0.04);
+    --card-border: rgba(255,255,255,0.08);
+  }}
+
+  body {{
+    font-family: 'Inter', sans-serif;
+    background: var(--navy);
+    color: var(--white);
+    line-height: 1.7;
+    padding: 40px 20px 80px;
+    max-width: 900px;
+    margin: 0 auto;
+  }}
+
+  h1, h2, h3 {{ font-family: 'Playfair Display', serif; font-weight: 700; }}
+  h1 {{ font-size: 2.4rem; font-weight: 800; text-align: center; margin-bottom: 12px; }}
+  h2 {{ font-size: 1.5rem; margin: 48px 0 16px; color: var(--gold); }}
+  h3 {{ font-size: 1.15rem; margin: 24px 0 10px; color: var(--teal); }}
+  .headerlink {{ color: var(--dim); text-decoration: none; margin-left: 8px; opacity: 0; }}
+  h2:hover .headerlink, h3:hover .headerlink {{ opacity: 1; }}
+
+  p, li {{ font-size: 0.95rem; line-height: 1.85; color: var(--light); }}
+  p + p {{ margin-top: 14px; }}
+  ul, ol {{ margin: 12px 0 12px 24px; }}
+  strong {{ color: var(--white); font-weight: 600; }}
+  a {{ color: var(--gold); }}
+
+  blockquote {{
+    background: var(--card);
+    border: 1px solid var(--card-border);
+    border-left: 3px solid var(--gold);
+    border-radius: 14px;
+    padding: 20px 28px;
+    margin: 16px 0;
+  }}
+  blockquote p {{ font-style: italic; color: rgba(255,255,255,0.85); }}
+
+  hr {{
+    border: none;
+    height: 1px;
+    background: linear-gradient(90deg, transparent, var(--card-border), transparent);
+    margin: 48px 0;
+  }}
+
+  table {{ width: 100%; border-collapse: collapse; margin: 16px 0; font-size: 0.9rem; }}
+  th, td {{ border: 1px solid var(--card-border); padding: 8px 12px; text-align: left; }}
+  th {{ color: var(--gold); background: var(--card); }}
+
+  /* Table of contents */
+  .toc-card {{
+    background: var(--card);
+    border: 1px solid var(--card-border);
+    border-radius: 14px;
+    padding: 20px 28px;
+    margin: 32px 0 16px;
+  }}
+  .toc-card .label {{
+    font-size: 0.75rem;
+    text-transform: uppercase;
+    letter-spacing: 1.5px;
+    color: var(--dim);
+    font-weight: 600;
+  }}
+  .toc ul {{ list-style: none; margin: 8px 0 0 0; }}
+  .toc ul ul {{ margin-left: 18px; }}
+  .toc a {{ color: var(--light); text-decoration: none; }}
+  .toc a:hover {{ color: var(--gold); }}
+</style>
+</head>
+<body>
+
+<nav class="toc-card">
+  <div class="label">Contents</div>
+  {toc}
+</nav>
+
+{body}
+
+</body>
+</html>
+"""
+
+
+# ─── Rendering ───────────────────────────────────────────────────────────────
+def find_sources(root=BASE):
+    sources = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS and not d.startswith("."))
+        sources += [os.path.join(dirpath, f) for f in sorted(filenames) if f.endswith(".md")]
+    return sources
+
+
+def output_path(src):
+    rel = os.path.relpath(src, BASE)
+    return os.path.join(OUT_DIR, os.path.splitext(rel)[0] + ".html")
+
+
+def config_digest():
+    """Hash of everything besides the source that shapes a page, so changing any of it re-renders all."""
+    config = json.dumps([PAGE, EXTENSIONS, EXTENSION_CONFIGS, markdown.__version__], sort_keys=True)
+    return hashlib.sha256(config.encode()).hexdigest()
+
+
+def source_digest(src, config):
+    with open(src, "rb") as f:
+        data = f.read()
+    return hashlib.sha256(config.encode() + data).hexdigest()
+
+
+def render(src):
+    """Render one Markdown file; runs in a worker process."""
+    with open(src, encoding="utf-8") as f:
+        text = f.read()
+    md = markdown.Markdown(extensions=EXTENSIONS, extension_configs=EXTENSION_CONFIGS)
+    body = md.convert(text)
+    h1 = re.search(r"<h1[^>]*>(.*?)(?:<a class=\"headerlink\"|</h1>)", body)
+    title = re.sub(r"<[^>]+>", "", h1.group(1)) if h1 else os.path.basename(src)
+    page = PAGE.format(title=html.escape(html.unescape(title)), toc=md.toc, body=body)
+
+    out = output_path(src)
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        f.write(page)
+    return out
+
+
+def load_cache():
+    if not os.path.exists(CACHE_PATH):
+        return {}
+    with open(CACHE_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def render_all(sources, force=False, jobs=None):
+    """Render every changed source in parallel; returns (rendered, skipped) paths."""
+    cache = load_cache()
+    config = config_digest()
+    digests = {os.path.relpath(s, BASE): source_digest(s, config) for s in sources}
+    stale = [s for s in sources
+             if force or not os.path.exists(output_path(s))
+             or cache.get(os.path.relpath(s, BASE)) != digests[os.path.relpath(s, BASE)]]
+    skipped = [s for s in sources if s not in stale]
+
+    rendered = []
+    if len(stale) == 1:
+        rendered = [render(stale[0])]
+    elif stale:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            rendered = list(pool.map(render, stale))
+
+    cache.update(digests)
+    with open(CACHE_PATH, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    return rendered, skipped
+
+
+# ─── Main ────────────────────────────────────────────────────────────────────
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("sources", nargs="*", help="Markdown files (default: every .md in the repo)")
+    parser.add_argument("--force", action="store_true", help="re-render even if the source is unchanged")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    sources = [os.path.abspath(s) for s in args.sources] or find_sources()
+    rendered, skipped = render_all(sources, force=args.force, jobs=args.jobs)
+    for out in rendered:
+        print(f"✅ Rendered {os.path.relpath(out, BASE)}")
+    print(f"   {len(rendered)} rendered, {len(skipped)} unchanged")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""Batched shape emission: build slide shapes from XML templates and append them in one lxml pass.
+
+python-pptx builds every shape through dozens of small property setters, each
+looking up or creating child elements. Here shapes are rendered from string
+templates that match what python-pptx itself would produce, parsed together
+and moved into the slide's spTree:
+
+    with ShapeBatch(slide) as batch:
+        emit(batch, shape_xml("rect", x, y, w, h, fill=GOLD))
+        emit(batch, textbox_xml(x, y, w, h, [paragraph_xml([run_xml("Hi", "Calibri", Pt(18), WHITE)])]))
+
+Pictures reuse python-pptx's image-part lookup by SHA-1, which it doesn't expose for
+an already loaded Image; that is why the deploy workflow pins python-pptx to 1.0.x.
+"""
+
+import os
+import re
+from xml.sax.saxutils import escape, quoteattr
+
+from pptx.enum.text import PP_ALIGN
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from pptx.parts.image import Image, ImagePart
+
+# ─── Templates ───────────────────────────────────────────────────────────────
+GEOMETRIES = {"rect": "Rectangle", "roundRect": "Rounded Rectangle", "ellipse": "Oval"}
+
+SHAPE_STYLE = (
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+)
+XFRM = '<a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+
+# __ID__ and __NUM__ are filled in when the batch is flushed and shape ids are known.
+SP = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="__ID__" name="{name} __NUM__"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr>' + XFRM + '<a:prstGeom prst="{geom}"><a:avLst/></a:prstGeom>{fill}{line}</p:spPr>'
+    + SHAPE_STYLE +
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/>{paragraphs}</p:txBody></p:sp>'
+)
+TEXTBOX = (
+    '<p:sp><p:nvSpPr><p:cNvPr id="__ID__" name="TextBox __NUM__"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr>' + XFRM + '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="{wrap}"><a:spAutoFit/></a:bodyPr><a:lstStyle/>{paragraphs}</p:txBody></p:sp>'
+)
+PIC = (
+    '<p:pic><p:nvPicPr><p:cNvPr id="__ID__" name="Picture __NUM__" descr={descr}/>'
+    '<p:cNvPicPr><a:picLocks noChangeAspect="1"/></p:cNvPicPr><p:nvPr/></p:nvPicPr>'
+    '<p:blipFill><a:blip r:embed="{rId}"/>{crop}<a:stretch><a:fillRect/></a:stretch></p:blipFill>'
+    '<p:spPr>' + XFRM + '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr></p:pic>'
+)
+RPR = '<a:rPr sz="{sz}" b="{b}" i="{i}"><a:solidFill><a:srgbClr val="{color}"/></a:solidFill><a:latin typeface={font}/></a:rPr>'
+
+_CTRL_CHARS = re.compile(r"([\x00-\x08\x0B-\x1F])")
+
+
+# ─── Text ────────────────────────────────────────────────────────────────────
+def _text(s):
+    # Same escaping python-pptx applies to run text: control characters become _xHHHH_.
+    return escape(_CTRL_CHARS.sub(lambda m: "_x%04X_" % ord(m.group(1)), s))
+
+
+def rpr_xml(font_name, size, color, bold=False, italic=False):
+    return RPR.format(sz=round(size.pt * 100), b=int(bool(bold)), i=int(bool(italic)),
+                      color=str(color), font=quoteattr(font_name))
+
+
+def run_xml(text, font_name, size, color, bold=False, italic=False):
+    """One styled run. Line feeds are kept in the run, as python-pptx's `run.text` does."""
+    return f"<a:r>{rpr_xml(font_name, size, color, bold, italic)}<a:t>{_text(text)}</a:t></a:r>"
+
+
+def lines_xml(text, font_name, size, color, bold=False, italic=False):
+    """Runs for `text` with each line break as <a:br/>, every line styled alike."""
+    rpr = rpr_xml(font_name, size, color, bold, italic)
+    return f"<a:br>{rpr}</a:br>".join(
+        f"<a:r>{rpr}<a:t>{_text(line)}</a:t></a:r>" for line in re.split("[\n\v]", text))
+
+
+def paragraph_xml(runs, alignment=None, space_before=None, space_after=None):
+    """An <a:p> from run XML (a string or list of strings) and optional paragraph properties."""
+    if not isinstance(runs, str):
+        runs = "".join(runs)
+    attrs = f' algn="{PP_ALIGN.to_xml(alignment)}"' if alignment is not None else ""
+    spacing = ""
+    if space_before is not None:
+        spacing += f'<a:spcBef><a:spcPts val="{round(space_before.pt * 100)}"/></a:spcBef>'
+    if space_after is not None:
+        spacing += f'<a:spcAft><a:spcPts val="{round(space_after.pt * 100)}"/></a:spcAft>'
+    if attrs or spacing:
+        ppr = f"<a:pPr{attrs}>{spacing}</a:pPr>" if spacing else f"<a:pPr{attrs}/>"
+    else:
+        ppr = ""
+    return f"<a:p>{ppr}{runs}</a:p>"
+
+
+# ─── Shapes ──────────────────────────────────────────────────────────────────
+def _fill_xml(color):
+    return f'<a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+
+
+def shape_xml(geom, left, top, width, height, fill=None, line=None, line_width=None, paragraphs=()):
+    """An auto shape ("rect", "roundRect" or "ellipse"); `line=None` means no outline."""
+    if line is None:
+        ln = "<a:ln><a:noFill/></a:ln>"
+    elif line_width is not None:
+        ln = f'<a:ln w="{int(line_width)}">{_fill_xml(line)}</a:ln>'
+    else:
+        ln = f"<a:ln>{_fill_xml(line)}</a:ln>"
+    return SP.format(
+        name=GEOMETRIES[geom], geom=geom, x=int(left), y=int(top), cx=int(width), cy=int(height),
+        fill=_fill_xml(fill) if fill is not None else "", line=ln,
+        paragraphs="".join(paragraphs) or '<a:p><a:pPr algn="ctr"/></a:p>')
+
+
+def textbox_xml(left, top, width, height, paragraphs=(), wrap=True):
+    return TEXTBOX.format(x=int(left), y=int(top), cx=int(width), cy=int(height),
+                          wrap="square" if wrap else "none", paragraphs="".join(paragraphs) or "<a:p/>")
+
+
+def _image_part(slide, image_file):
+    """slide.part.get_or_add_image_part() that also accepts an already loaded pptx Image."""
+    if not isinstance(image_file, Image):
+        return slide.part.get_or_add_image_part(image_file)
+    # The public call takes a path or stream and would hash the blob again on this thread.
+    # _find_by_sha1() is private; python-pptx is pinned to 1.0.x in .github/workflows/pages.yml.
+    package = slide.part.package
+    image_part = package._image_parts._find_by_sha1(image_file.sha1) or ImagePart.new(package, image_file)
+    return image_part, slide.part.relate_to(image_part, RT.IMAGE)
+
+
+def picture_xml(slide, image_file, left, top, width=None, height=None, crop=None):
+    """A picture from a path, file object or pptx Image; adds (or reuses) the image part now, the shape itself is batched."""
+    image_part, rId = _image_part(slide, image_file)
+    cx, cy = image_part.scale(width, height)
+    src = ""
+    if crop and any(crop):
+        l, t, r, b = (round(c * 100000) for c in crop)
+        src = f'<a:srcRect l="{l}" t="{t}" r="{r}" b="{b}"/>'
+    if isinstance(image_file, Image):
+        descr = image_file.filename or "image"
+    else:
+        descr = os.path.basename(image_file) if isinstance(image_file, str) else "image"
+    return PIC.format(rId=rId, descr=quoteattr(descr), crop=src,
+                      x=int(left), y=int(top), cx=int(cx), cy=int(cy))
+
+
+# ─── Emission ────────────────────────────────────────────────────────────────
+def append_shapes(slide, fragments):
+    """Parse all `fragments` in one pass, number them and append them to the slide's spTree."""
+    if not fragments:
+        return []
+    spTree = slide.element.cSld.spTree
+    ids = [int(i) for i in spTree.xpath("//@id") if i.isdigit()]
+    next_id = max(ids, default=0) + 1
+    xml = []
+    for n, fragment in enumerate(fragments):
+        shape_id = next_id + n
+        xml.append(fragment.replace("__ID__", str(shape_id), 1).replace("__NUM__", str(shape_id - 1), 1))
+    tree = parse_xml(f"<p:spTree {nsdecls('p', 'a', 'r')}>{''.join(xml)}</p:spTree>")
+    elements = list(tree)
+    for el in elements:
+        spTree.insert_element_before(el, "p:extLst")
+    return elements
+
+
+class ShapeBatch:
+    """Queues shape XML for one slide; flushed in a single parse when the `with` block ends.
+
+    Shapes keep the order they were queued in. Don't add shapes to the slide directly
+    inside the block, or they will end up underneath the queued ones.
+    """
+
+    def __init__(self, slide):
+        self.slide = slide
+        self.fragments = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+
+    def flush(self):
+        elements = append_shapes(self.slide, self.fragments)
+        self.fragments = []
+        return elements
+
+
+def emit(batch, fragment):
+    """Queue `fragment` on `batch`; it is parsed and numbered when the batch is flushed."""
+    batch.fragments.append(fragment)
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""Aggregate survey/attendance CSV exports into the impact numbers used by both decks."""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+
+# ─── Constants ───────────────────────────────────────────────────────────────
+BASE = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BASE, "survey-data")
+CACHE_PATH = os.path.join(BASE, ".survey-cache.json")
+HTML_PATH = os.path.join(BASE, "presentation.html")
+
+CACHE_VERSION = 2
+CHUNK_ROWS = 4096
+TOP_N = 5
+
+ID_COLUMNS = ("student_id", "email", "email address", "name", "respondent")
+ROLE_COLUMNS = ("role", "position", "participant type")
+AMBASSADOR_MARKER = "ambassador"     # "Ambassador", "Student Ambassador", ...
+EVENT_COLUMNS = ("event", "event name", "workshop")
+ACTIVITY_MARKER = "activit"          # "Activities", "Activity interest", ...
+MULTI_SEP = re.compile(r"\s*[;,]\s*")
+
+LIKERT_LABELS = {
+    "strongly disagree": 1, "disagree": 2, "neutral": 3, "agree": 4, "strongly agree": 5,
+    "1": 1, "2": 2, "3": 3, "4": 4, "5": 5,
+}
+LIKERT_POINTS = 5
+
+# Shown on slide 13 when no exports are present; the last two are not derivable from surveys.
+# "ambassadors" is only taken from the exports when they have a role column (see aggregate()).
+DEFAULT_IMPACT = {"ambassadors": 20, "events": 4, "styles": 4, "grant_k": 10}
+
+
+# ─── Accumulators ────────────────────────────────────────────────────────────
+def _numpy():
+    """numpy, imported on first use: impact_numbers() needs none for the fallback or a cache hit."""
+    import numpy
+    return numpy
+
+
+class Counter:
+    """Interns string values to integer codes and counts them with np.bincount per chunk."""
+
+    def __init__(self):
+        np = _numpy()
+        self.codes = {}
+        self.names = []
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def add(self, values):
+        np = _numpy()
+        if not values:
+            return
+        codes = np.fromiter((self._code(v) for v in values), dtype=np.int64, count=len(values))
+        chunk = np.bincount(codes, minlength=len(self.names))
+        if len(self.counts) < len(chunk):
+            self.counts = np.pad(self.counts, (0, len(chunk) - len(self.counts)))
+        self.counts += chunk
+
+    def _code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.names)
+            self.names.append(value)
+        return code
+
+    def top(self, n):
+        np = _numpy()
+        order = np.argsort(-self.counts, kind="stable")[:n]
+        return [[self.names[i], int(self.counts[i])] for i in order]
+
+
+class LikertCounter:
+    """Distribution of one Likert question; code 0 collects blanks and unparseable answers."""
+
+    def __init__(self):
+        np = _numpy()
+        self.counts = np.zeros(LIKERT_POINTS + 1, dtype=np.int64)
+
+    def add(self, column):
+        np = _numpy()
+        codes = np.fromiter((LIKERT_LABELS.get(v.strip().lower(), 0) for v in column),
+                            dtype=np.int8, count=len(column))
+        self.counts += np.bincount(codes, minlength=LIKERT_POINTS + 1)
+
+    def summary(self):
+        np = _numpy()
+        dist = self.counts[1:]
+        answered = int(dist.sum())
+        mean = float(np.dot(dist, np.arange(1, LIKERT_POINTS + 1)) / answered) if answered else None
+        return {"counts": dist.tolist(), "answered": answered,
+                "mean": round(mean, 2) if mean is not None else None}
+
+
+# ─── Streaming ───────────────────────────────────────────────────────────────
+def iter_chunks(reader, size=CHUNK_ROWS):
+    chunk = []
+    for row in reader:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def find_column(header, names):
+    for i, h in enumerate(header):
+        if h.strip().lower() in names:
+            return i
+    return None
+
+
+def is_likert(values):
+    filled = [v.strip().lower() for v in values if v.strip()]
+    return bool(filled) and all(v in LIKERT_LABELS for v in filled)
+
+
+def aggregate(paths):
+    """Stream every CSV once and return the combined statistics.
+
+    "participants" counts every distinct respondent ID across all exports. "ambassadors"
+    counts only the IDs whose role column (if an export has one) mentions "ambassador";
+    without role columns it is 0 and slide 13 keeps DEFAULT_IMPACT.
+    """
+    people, ambassadors, events, activities = Counter(), Counter(), Counter(), Counter()
+    likert = {}
+    responses = attendance_rows = 0
+
+    for path in paths:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header:
+                continue
+            id_col = find_column(header, ID_COLUMNS)
+            role_col = find_column(header, ROLE_COLUMNS)
+            event_col = find_column(header, EVENT_COLUMNS)
+            activity_cols = [i for i, h in enumerate(header) if ACTIVITY_MARKER in h.lower()]
+            likert_cols = None  # decided from the first chunk of each file
+
+            for chunk in iter_chunks(reader):
+                width = len(header)
+                cols = list(zip(*(row + [""] * (width - len(row)) for row in chunk)))
+                if id_col is not None:
+                    people.add([v.strip().lower() for v in cols[id_col] if v.strip()])
+                    if role_col is not None:
+                        ambassadors.add([v.strip().lower() for v, role in zip(cols[id_col], cols[role_col])
+                                         if v.strip() and AMBASSADOR_MARKER in role.lower()])
+                if event_col is not None:
+                    # Attendance export: one row per (student, event)
+                    attendance_rows += len(chunk)
+                    events.add([v.strip() for v in cols[event_col] if v.strip()])
+                    continue
+
+                responses += len(chunk)
+                for i in activity_cols:
+                    activities.add([a for v in cols[i] for a in MULTI_SEP.split(v.strip()) if a])
+                if likert_cols is None:
+                    skip = {id_col, *activity_cols}
+                    likert_cols = [i for i in range(width) if i not in skip and is_likert(cols[i])]
+                for i in likert_cols:
+                    likert.setdefault(header[i].strip(), LikertCounter()).add(cols[i])
+
+    return {
+        "responses": responses,
+        "attendance_rows": attendance_rows,
+        "participants": len(people.names),
+        "ambassadors": len(ambassadors.names),
+        "events": len(events.names),
+        "likert": {q: c.summary() for q, c in likert.items()},
+        "top_activities": activities.top(TOP_N),
+        "top_events": events.top(TOP_N),
+    }
+
+
+# ─── Cache ───────────────────────────────────────────────────────────────────
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def input_key(paths):
+    h = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+    for path in paths:
+        h.update(os.path.relpath(path, BASE).encode())
+        h.update(file_digest(path).encode())
+    return h.hexdigest()
+
+
+def load_stats(paths=None, use_cache=True):
+    """Aggregated stats for `paths` (default: every CSV in survey-data/), cached by input hash."""
+    paths = sorted(paths if paths is not None else find_exports())
+    key = input_key(paths)
+    if use_cache and os.path.exists(CACHE_PATH):
+        with open(CACHE_PATH, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("key") == key:
+            return cached["stats"]
+    stats = aggregate(paths)
+    with open(CACHE_PATH, "w", encoding="utf-8") as f:
+        json.dump({"key": key, "stats": stats}, f, indent=2, sort_keys=True)
+    return stats
+
+
+def find_exports(data_dir=DATA_DIR):
+    if not os.path.isdir(data_dir):
+        return []
+    return [os.path.join(data_dir, n) for n in os.listdir(data_dir) if n.lower().endswith(".csv")]
+
+
+def impact_numbers(paths=None):
+    """(numbers for the slide 13 counters, where they came from).
+
+    "ambassadors" and "events" come from the exports when they provide them, otherwise
+    from DEFAULT_IMPACT with a warning on stderr; "styles" and "grant_k" are always defaults.
+    """
+    impact = dict(DEFAULT_IMPACT)
+    paths = paths or find_exports()
+    fallback = ["ambassadors", "events"]
+    if paths:
+        stats = load_stats(paths)
+        fallback = [key for key in fallback if not stats[key]]
+        for key in ("ambassadors", "events"):
+            if stats[key]:
+                impact[key] = stats[key]
+        source = f"{len(paths)} CSV export{'s' if len(paths) != 1 else ''}"
+    else:
+        source = f"no CSV exports in {os.path.relpath(DATA_DIR, BASE)}/"
+    if fallback:
+        defaults = ", ".join(f"{key}={DEFAULT_IMPACT[key]}" for key in fallback)
+        print(f"⚠️  Impact numbers: {source}, using built-in {defaults}", file=sys.stderr)
+        source += f", built-in {defaults}"
+    return impact, source
+
+
+# ─── HTML ────────────────────────────────────────────────────────────────────
+def write_html_counters(impact, html_path=HTML_PATH):
+    """Rewrite the data-target of every `data-stat` counter in presentation.html."""
+    with open(html_path, encoding="utf-8") as f:
+        html = f.read()
+
+    def repl(m):
+        key = m.group(2)
+        if key not in impact:
+            return m.group(0)
+        return f'{m.group(1)}{impact[key]}{m.group(3)}'
+
+    updated = re.sub(r'(data-stat="(\w+)" data-target=")\d+(")', repl, html)
+    if updated != html:
+        with open(html_path, "w", encoding="utf-8") as f:
+            f.write(updated)
+    return updated != html
+
+
+# ─── Main ────────────────────────────────────────────────────────────────────
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("paths", nargs="*", help="CSV exports (default: survey-data/*.csv)")
+    parser.add_argument("--no-cache", action="store_true", help="ignore the cached result")
+    parser.add_argument("--json", action="store_true", help="print the full stats as JSON")
+    parser.add_argument("--write-html", action="store_true", help="update the slide 13 counters in presentation.html")
+    args = parser.parse_args(argv)
+
+    paths = args.paths or find_exports()
+    if not paths:
+        print(f"No CSV exports found in {DATA_DIR}")
+        return 1
+    stats = load_stats(paths, use_cache=not args.no_cache)
+
+    if args.json:
+        json.dump(stats, sys.stdout, indent=2, sort_keys=True)
+        print()
+    else:
+        print(f"📊 {len(paths)} files · {stats['responses']} survey responses · {stats['attendance_rows']} attendance rows")
+        print(f"   {stats['participants']} participants ({stats['ambassadors']} ambassadors by role) · {stats['events']} events")
+        for question, s in stats["likert"].items():
+            print(f"   {question}: mean {s['mean']} over {s['answered']} answers {s['counts']}")
+        for name, count in stats["top_activities"]:
+            print(f"   ▸ {name}: {count}")
+
+    if args.write_html:
+        impact, _ = impact_numbers(paths)
+        changed = write_html_counters(impact)
+        print(f"✅ {'Updated' if changed else 'Unchanged'} {HTML_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())